@@ -0,0 +1,70 @@
+"""
+Millisecond-granularity UTC clock.
+
+Model factories stamp every record with ``datetime.utcnow()`` and later
+format it with ``isoformat()`` on each serialization. This module caches
+the current tick (datetime plus its ISO string) per millisecond so that
+records created within the same millisecond share one formatted string;
+models derive their ISO timestamps through ``isoformat()``.
+
+The cache is refreshed lazily on read rather than by a ticker thread, so
+an idle process does no work and never contends for the GIL.
+"""
+
+import time
+from datetime import datetime, timedelta
+
+_EPOCH = datetime(1970, 1, 1)
+
+# (epoch milliseconds, naive UTC datetime, ISO string) for the current tick
+_tick: tuple[int, datetime, str] = (-1, _EPOCH, _EPOCH.isoformat())
+
+
+def utcnow() -> datetime:
+    """
+    Get the current UTC time at 1ms granularity.
+    
+    Returns:
+        Naive UTC datetime, shared by every call within the same millisecond
+    """
+    global _tick
+    
+    now_ms = time.time_ns() // 1_000_000
+    tick = _tick
+    if tick[0] != now_ms:
+        now = _EPOCH + timedelta(milliseconds=now_ms)
+        tick = (now_ms, now, now.isoformat())
+        _tick = tick
+    
+    return tick[1]
+
+
+def from_epoch_ns(ts_ns: int) -> datetime:
+    """
+    Convert epoch nanoseconds, e.g. from ``time.time_ns()``, to a datetime.
+    
+    Args:
+        ts_ns: Nanoseconds since the Unix epoch
+        
+    Returns:
+        Naive UTC datetime, truncated to microseconds
+    """
+    return _EPOCH + timedelta(microseconds=ts_ns // 1000)
+
+
+def isoformat(dt: datetime) -> str:
+    """
+    Format a datetime as ``datetime.isoformat()`` does.
+    
+    Reuses the cached string when ``dt`` is the current tick from utcnow().
+    
+    Args:
+        dt: Datetime to format
+        
+    Returns:
+        ISO 8601 string
+    """
+    tick = _tick
+    if tick[1] is dt:
+        return tick[2]
+    return dt.isoformat()
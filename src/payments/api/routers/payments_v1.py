@@ -25,7 +25,7 @@ from payments.api.schemas.payments import (
 )
 from payments.errors import PaymentNotFoundError
 from payments.feature_flags import ENABLE_LEGACY_PAYMENTS
-from payments.utils.crypto_legacy import compute_md5
+from payments.utils.crypto_legacy import compute_md5_bytes
 
 router = APIRouter()
 
@@ -63,7 +63,7 @@ async def create_payment_legacy(
     # TODO(TEAM-SEC): Replace MD5 with secure hashing
     idempotency_hash = None
     if x_idempotency_key:
-        idempotency_hash = compute_md5(x_idempotency_key.encode("utf-8"))
+        idempotency_hash = compute_md5_bytes(x_idempotency_key.encode("utf-8"))
         logging.info("Idempotency hash: %s", idempotency_hash)
     
     # Process payment using legacy service method
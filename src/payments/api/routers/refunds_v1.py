@@ -15,7 +15,7 @@ from payments.api.dependencies import RefundServiceDep, RequestContextDep
 from payments.api.schemas.refunds import CreateRefundRequestV1, RefundResponseV1
 from payments.errors import RefundNotFoundError
 from payments.feature_flags import ENABLE_LEGACY_PAYMENTS
-from payments.utils.crypto_legacy import compute_sha1
+from payments.utils.crypto_legacy import compute_sha1_bytes
 
 router = APIRouter()
 
@@ -52,7 +52,7 @@ async def create_refund_legacy(
         logging.info("Partial refund amount: %d", request.refund_amount)
     
     # TODO(TEAM-SEC): Remove SHA1 usage
-    reference_hash = compute_sha1(request.payment_reference.encode("utf-8"))
+    reference_hash = compute_sha1_bytes(request.payment_reference.encode("utf-8"))
     logging.info("Reference hash: %s", reference_hash)
     
     result = await service.create_refund_legacy(
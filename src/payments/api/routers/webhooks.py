@@ -8,6 +8,7 @@ and refund statuses.
 import logging
 from typing import Annotated, Optional
 
+import orjson
 from fastapi import APIRouter, Header, HTTPException, Request
 
 from payments.api.schemas.webhooks import (
@@ -19,7 +20,7 @@ from payments.config import get_settings
 from payments.errors import WebhookSignatureError
 from payments.feature_flags import ENABLE_LEGACY_WEBHOOK_VALIDATION
 from payments.logging_config import get_logger
-from payments.utils.crypto_legacy import compute_sha1, verify_hmac_sha256
+from payments.utils.crypto_legacy import compute_sha1_bytes, verify_hmac_sha256
 
 router = APIRouter()
 logger = get_logger(__name__)
@@ -54,8 +55,7 @@ async def handle_stripe_webhook(
             raise HTTPException(status_code=401, detail="Invalid signature")
     
     # Parse the payload
-    import json
-    payload_data = json.loads(body)
+    payload_data = orjson.loads(body)
     payload = StripeWebhookPayload(**payload_data)
     
     logger.info(
@@ -101,11 +101,10 @@ async def handle_paypal_webhook(
     # TODO(TEAM-SEC): Implement proper PayPal signature verification
     if ENABLE_LEGACY_WEBHOOK_VALIDATION and paypal_transmission_sig:
         # Legacy validation using SHA1 - TODO(TEAM-SEC): Replace with proper PayPal SDK
-        legacy_hash = compute_sha1(body)
+        legacy_hash = compute_sha1_bytes(body)
         logging.info("PayPal webhook legacy hash: %s", legacy_hash)
     
-    import json
-    payload_data = json.loads(body)
+    payload_data = orjson.loads(body)
     payload = PayPalWebhookPayload(**payload_data)
     
     logger.info(
@@ -9,18 +9,23 @@ All payment providers must implement this interface.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 
 @dataclass
 class ChargeResult:
-    """Result of a charge operation."""
+    """
+    Result of a charge operation.
+    
+    raw_response is either a dict or a provider-specific NamedTuple
+    (use ``._asdict()`` when a mapping is needed).
+    """
     
     success: bool
     provider_transaction_id: Optional[str] = None
     error_code: Optional[str] = None
     error_message: Optional[str] = None
-    raw_response: Optional[dict[str, Any]] = None
+    raw_response: Optional[Union[dict[str, Any], tuple[Any, ...]]] = None
 
 
 @dataclass
@@ -3,9 +3,14 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 import uuid
 
+from payments import _clock
+
+if TYPE_CHECKING:
+    from payments.api.schemas.payments import PaymentResponse, PaymentResponseV1
+
 
 class PaymentStatus(str, Enum):
     """Payment status enumeration."""
@@ -24,7 +29,13 @@ class PaymentProvider(str, Enum):
     PAYPAL = "paypal"
 
 
-@dataclass
+_REFUNDABLE_STATUSES: frozenset[PaymentStatus] = frozenset({
+    PaymentStatus.CAPTURED,
+    PaymentStatus.PARTIALLY_REFUNDED,
+})
+
+
+@dataclass(slots=True)
 class Payment:
     """
     Payment domain model.
@@ -46,6 +57,21 @@ class Payment:
     metadata: dict[str, Any] = field(default_factory=dict)
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
+    created_at_iso: str = field(default="", init=False, repr=False, compare=False)
+    # v1 API form of the ID, e.g. PAY-1A2B...
+    legacy_id: str = field(default="", init=False, repr=False, compare=False)
+    # API responses built by the service layer; cleared on every change
+    cached_response: Optional["PaymentResponse"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    cached_response_v1: Optional["PaymentResponseV1"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self) -> None:
+        """Fill in the derived ID and timestamp strings."""
+        self.legacy_id = self.id.replace("pay_", "PAY-").upper()
+        self.created_at_iso = _clock.isoformat(self.created_at)
     
     @classmethod
     def create(
@@ -59,7 +85,7 @@ class Payment:
         metadata: Optional[dict[str, Any]] = None,
     ) -> "Payment":
         """Create a new payment."""
-        now = datetime.utcnow()
+        now = _clock.utcnow()
         return cls(
             id=f"pay_{uuid.uuid4().hex[:16]}",
             status=PaymentStatus.PENDING,
@@ -78,24 +104,24 @@ class Payment:
         """Mark payment as authorized."""
         self.status = PaymentStatus.AUTHORIZED
         self.provider_transaction_id = provider_transaction_id
-        self.updated_at = datetime.utcnow()
+        self._touch()
     
     def capture(self, amount_cents: Optional[int] = None) -> None:
         """Capture the payment."""
         capture_amount = amount_cents or self.amount_cents
         self.captured_amount_cents = capture_amount
         self.status = PaymentStatus.CAPTURED
-        self.updated_at = datetime.utcnow()
+        self._touch()
     
     def fail(self) -> None:
         """Mark payment as failed."""
         self.status = PaymentStatus.FAILED
-        self.updated_at = datetime.utcnow()
+        self._touch()
     
     def cancel(self) -> None:
         """Cancel the payment."""
         self.status = PaymentStatus.CANCELLED
-        self.updated_at = datetime.utcnow()
+        self._touch()
     
     def refund(self, amount_cents: int) -> None:
         """Record a refund against this payment."""
@@ -104,7 +130,18 @@ class Payment:
             self.status = PaymentStatus.REFUNDED
         else:
             self.status = PaymentStatus.PARTIALLY_REFUNDED
+        self._touch()
+    
+    def set_provider_transaction_id(self, provider_transaction_id: Optional[str]) -> None:
+        """Record the provider's transaction ID."""
+        self.provider_transaction_id = provider_transaction_id
+        self._touch()
+    
+    def _touch(self) -> None:
+        """Mark the payment as modified and drop cached responses."""
         self.updated_at = datetime.utcnow()
+        self.cached_response = None
+        self.cached_response_v1 = None
     
     @property
     def available_refund_amount(self) -> int:
@@ -119,10 +156,7 @@ class Payment:
     @property
     def is_refundable(self) -> bool:
         """Check if payment can be refunded."""
-        return self.status in (
-            PaymentStatus.CAPTURED,
-            PaymentStatus.PARTIALLY_REFUNDED,
-        ) and self.available_refund_amount > 0
+        return self.status in _REFUNDABLE_STATUSES and self.available_refund_amount > 0
     
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -139,7 +173,7 @@ class Payment:
             "refunded_amount_cents": self.refunded_amount_cents,
             "description": self.description,
             "metadata": self.metadata,
-            "created_at": self.created_at.isoformat(),
+            "created_at": self.created_at_iso,
             "updated_at": self.updated_at.isoformat(),
         }
 
@@ -175,12 +209,12 @@ class PaymentLegacy:
         }
         
         return cls(
-            payment_id=payment.id.replace("pay_", "PAY-").upper(),
+            payment_id=payment.legacy_id,
             status_code=status_map.get(payment.status, "UNKNOWN"),
             amount=payment.amount_cents,
             currency_code=payment.currency,
             user_id=payment.customer_id,
             order_reference=payment.order_id.replace("ord_", "ORD-").upper(),
             transaction_reference=payment.provider_transaction_id,
-            created=payment.created_at.isoformat(),
+            created=payment.created_at_iso,
         )
@@ -3,9 +3,14 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 import uuid
 
+from payments import _clock
+
+if TYPE_CHECKING:
+    from payments.api.schemas.refunds import RefundResponse, RefundResponseV1
+
 
 class RefundStatus(str, Enum):
     """Refund status enumeration."""
@@ -27,7 +32,7 @@ class RefundReason(str, Enum):
     OTHER = "other"
 
 
-@dataclass
+@dataclass(slots=True)
 class Refund:
     """
     Refund domain model.
@@ -46,6 +51,23 @@ class Refund:
     metadata: dict[str, Any] = field(default_factory=dict)
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
+    created_at_iso: str = field(default="", init=False, repr=False, compare=False)
+    # v1 API forms of the refund and payment IDs, e.g. REF-1A2B... / PAY-3C4D...
+    legacy_id: str = field(default="", init=False, repr=False, compare=False)
+    legacy_payment_id: str = field(default="", init=False, repr=False, compare=False)
+    # API responses built by the service layer; cleared on every change
+    cached_response: Optional["RefundResponse"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    cached_response_v1: Optional["RefundResponseV1"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self) -> None:
+        """Fill in the derived ID and timestamp strings."""
+        self.legacy_id = self.id.replace("ref_", "REF-").upper()
+        self.legacy_payment_id = self.payment_id.replace("pay_", "PAY-").upper()
+        self.created_at_iso = _clock.isoformat(self.created_at)
     
     @classmethod
     def create(
@@ -58,7 +80,7 @@ class Refund:
         metadata: Optional[dict[str, Any]] = None,
     ) -> "Refund":
         """Create a new refund."""
-        now = datetime.utcnow()
+        now = _clock.utcnow()
         return cls(
             id=f"ref_{uuid.uuid4().hex[:16]}",
             payment_id=payment_id,
@@ -76,22 +98,28 @@ class Refund:
         """Mark refund as processing."""
         self.status = RefundStatus.PROCESSING
         self.provider_refund_id = provider_refund_id
-        self.updated_at = datetime.utcnow()
+        self._touch()
     
     def complete(self) -> None:
         """Mark refund as completed."""
         self.status = RefundStatus.COMPLETED
-        self.updated_at = datetime.utcnow()
+        self._touch()
     
     def fail(self) -> None:
         """Mark refund as failed."""
         self.status = RefundStatus.FAILED
-        self.updated_at = datetime.utcnow()
+        self._touch()
     
     def cancel(self) -> None:
         """Cancel the refund."""
         self.status = RefundStatus.CANCELLED
+        self._touch()
+    
+    def _touch(self) -> None:
+        """Mark the refund as modified and drop cached responses."""
         self.updated_at = datetime.utcnow()
+        self.cached_response = None
+        self.cached_response_v1 = None
     
     @property
     def is_cancellable(self) -> bool:
@@ -110,7 +138,7 @@ class Refund:
             "provider_refund_id": self.provider_refund_id,
             "notes": self.notes,
             "metadata": self.metadata,
-            "created_at": self.created_at.isoformat(),
+            "created_at": self.created_at_iso,
             "updated_at": self.updated_at.isoformat(),
         }
 
@@ -153,11 +181,11 @@ class RefundLegacy:
         }
         
         return cls(
-            refund_id=refund.id.replace("ref_", "REF-").upper(),
-            payment_reference=refund.payment_id.replace("pay_", "PAY-").upper(),
+            refund_id=refund.legacy_id,
+            payment_reference=refund.legacy_payment_id,
             status_code=status_map.get(refund.status, "UNKNOWN"),
             refund_amount=refund.amount_cents,
             currency_code=refund.currency,
             reason_code=reason_map.get(refund.reason),
-            created=refund.created_at.isoformat(),
+            created=refund.created_at_iso,
         )
@@ -6,6 +6,8 @@ from enum import Enum
 from typing import Any, Optional
 import uuid
 
+from payments import _clock
+
 
 class TransactionType(str, Enum):
     """Types of transactions."""
@@ -42,6 +44,11 @@ class Transaction:
     error_message: Optional[str] = None
     metadata: dict[str, Any] = field(default_factory=dict)
     created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at_iso: str = field(default="", init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Fill in the cached ISO timestamp."""
+        self.created_at_iso = _clock.isoformat(self.created_at)
     
     @classmethod
     def create(
@@ -54,6 +61,7 @@ class Transaction:
         metadata: Optional[dict[str, Any]] = None,
     ) -> "Transaction":
         """Create a new transaction record."""
+        now = _clock.utcnow()
         return cls(
             id=f"txn_{uuid.uuid4().hex[:16]}",
             payment_id=payment_id,
@@ -63,7 +71,7 @@ class Transaction:
             currency=currency.upper(),
             provider=provider,
             metadata=metadata or {},
-            created_at=datetime.utcnow(),
+            created_at=now,
         )
     
     def succeed(self, provider_transaction_id: str) -> None:
@@ -91,7 +99,7 @@ class Transaction:
             "error_code": self.error_code,
             "error_message": self.error_message,
             "metadata": self.metadata,
-            "created_at": self.created_at.isoformat(),
+            "created_at": self.created_at_iso,
         }
 
 
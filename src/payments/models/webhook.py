@@ -6,6 +6,8 @@ from enum import Enum
 from typing import Any, Optional
 import uuid
 
+from payments import _clock
+
 
 class WebhookStatus(str, Enum):
     """Webhook processing status."""
@@ -39,6 +41,11 @@ class WebhookEvent:
     error_message: Optional[str] = None
     processed_at: Optional[datetime] = None
     created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at_iso: str = field(default="", init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Fill in the cached ISO timestamp."""
+        self.created_at_iso = _clock.isoformat(self.created_at)
     
     @classmethod
     def create(
@@ -49,6 +56,7 @@ class WebhookEvent:
         payload: dict[str, Any],
     ) -> "WebhookEvent":
         """Create a new webhook event record."""
+        now = _clock.utcnow()
         return cls(
             id=f"wh_{uuid.uuid4().hex[:16]}",
             provider=provider,
@@ -56,7 +64,7 @@ class WebhookEvent:
             event_type=event_type,
             status=WebhookStatus.RECEIVED,
             payload=payload,
-            created_at=datetime.utcnow(),
+            created_at=now,
         )
     
     def start_processing(self) -> None:
@@ -91,7 +99,7 @@ class WebhookEvent:
             "payload": self.payload,
             "error_message": self.error_message,
             "processed_at": self.processed_at.isoformat() if self.processed_at else None,
-            "created_at": self.created_at.isoformat(),
+            "created_at": self.created_at_iso,
         }
 
 
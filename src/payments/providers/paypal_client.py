@@ -4,8 +4,7 @@ PayPal payment provider implementation.
 This module implements the PaymentClient interface for PayPal payments.
 """
 
-import uuid
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional
 
 from payments.config import get_settings
 from payments.interfaces.payment_client import (
@@ -16,11 +15,26 @@ from payments.interfaces.payment_client import (
     VoidResult,
 )
 from payments.logging_config import get_logger
+from payments.utils.ids import prefixed_id
 
 logger = get_logger(__name__)
 settings = get_settings()
 
 
+class PayPalOrderRaw(NamedTuple):
+    """
+    Fields of a PayPal Order returned from a charge.
+    
+    Flattens the single purchase unit and capture of the Orders API response.
+    """
+    
+    id: str
+    status: str
+    amount_value: str
+    currency_code: str
+    capture_id: Optional[str] = None
+
+
 class PayPalPaymentClient(PaymentClient):
     """
     PayPal implementation of PaymentClient interface.
@@ -70,43 +84,14 @@ class PayPalPaymentClient(PaymentClient):
             },
         )
         
-        # Convert cents to dollars for PayPal API
-        amount_dollars = amount_cents / 100
-        
-        # Mock implementation for demo
         try:
-            order_id = f"ORDER-{uuid.uuid4().hex[:16].upper()}"
-            capture_id = f"CAP-{uuid.uuid4().hex[:16].upper()}" if capture else None
-            
-            logger.info(
-                "PayPal charge successful",
-                extra={
-                    "order_id": order_id,
-                    "capture_id": capture_id,
-                    "amount_dollars": amount_dollars,
-                },
-            )
-            
-            return ChargeResult(
-                success=True,
-                provider_transaction_id=capture_id or order_id,
-                raw_response={
-                    "id": order_id,
-                    "status": "COMPLETED" if capture else "CREATED",
-                    "purchase_units": [
-                        {
-                            "amount": {
-                                "value": str(amount_dollars),
-                                "currency_code": currency.upper(),
-                            },
-                            "payments": {
-                                "captures": [
-                                    {"id": capture_id, "status": "COMPLETED"}
-                                ] if capture else [],
-                            },
-                        }
-                    ],
-                },
+            order_id, capture_id = await self._call_provider_api(
+                amount_cents=amount_cents,
+                currency=currency,
+                customer_id=customer_id,
+                description=description,
+                metadata=metadata,
+                capture=capture,
             )
         except Exception as e:
             logger.error(
@@ -118,6 +103,68 @@ class PayPalPaymentClient(PaymentClient):
                 error_code="PAYPAL_ERROR",
                 error_message=str(e),
             )
+        
+        # Convert cents to dollars for PayPal API
+        amount_dollars = amount_cents / 100
+        
+        logger.info(
+            "PayPal charge successful",
+            extra={
+                "order_id": order_id,
+                "capture_id": capture_id,
+                "amount_dollars": amount_dollars,
+            },
+        )
+        
+        return self._build_success_response(
+            order_id,
+            capture_id,
+            amount_dollars=amount_dollars,
+            currency=currency,
+        )
+    
+    async def _call_provider_api(
+        self,
+        *,
+        capture: bool,
+        **params: Any,
+    ) -> tuple[str, Optional[str]]:
+        """
+        Send an order request to the PayPal API.
+        
+        This is the only part of a charge that can fail, so it is the only
+        part wrapped in error handling.
+        
+        TODO(TEAM-PAYMENTS): Call the PayPal Orders API here.
+        
+        Returns:
+            Tuple of (order ID, capture ID or None if not captured)
+        """
+        # Mock implementation for demo
+        order_id = prefixed_id(b"ORDER-")
+        capture_id = prefixed_id(b"CAP-") if capture else None
+        return order_id, capture_id
+    
+    @staticmethod
+    def _build_success_response(
+        order_id: str,
+        capture_id: Optional[str],
+        *,
+        amount_dollars: float,
+        currency: str,
+    ) -> ChargeResult:
+        """Build the result of a successful order (captured if capture_id is set)."""
+        return ChargeResult(
+            success=True,
+            provider_transaction_id=capture_id or order_id,
+            raw_response=PayPalOrderRaw(
+                id=order_id,
+                status="COMPLETED" if capture_id else "CREATED",
+                amount_value=str(amount_dollars),
+                currency_code=currency.upper(),
+                capture_id=capture_id,
+            ),
+        )
     
     async def capture(
         self,
@@ -138,7 +185,7 @@ class PayPalPaymentClient(PaymentClient):
             },
         )
         
-        capture_id = f"CAP-{uuid.uuid4().hex[:16].upper()}"
+        capture_id = prefixed_id(b"CAP-")
         
         return CaptureResult(
             success=True,
@@ -167,7 +214,7 @@ class PayPalPaymentClient(PaymentClient):
             },
         )
         
-        refund_id = f"REF-{uuid.uuid4().hex[:16].upper()}"
+        refund_id = prefixed_id(b"REF-")
         
         return RefundResult(
             success=True,
@@ -248,7 +295,7 @@ class LegacyPayPalClient:
         # Legacy logging pattern
         logging.info("Processing PayPal payment for user: %s", user_id)
         
-        order_id = f"PAL-{uuid.uuid4().hex[:16].upper()}"
+        order_id = prefixed_id(b"PAL-")
         
         return {
             "transaction_reference": order_id,
@@ -5,7 +5,7 @@ This module implements the PaymentClient interface for Stripe payments.
 """
 
 import uuid
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional
 
 from payments.config import get_settings
 from payments.errors import ProviderConnectionError, ProviderTimeoutError
@@ -22,6 +22,16 @@ logger = get_logger(__name__)
 settings = get_settings()
 
 
+class StripeChargeRaw(NamedTuple):
+    """Fields of a Stripe PaymentIntent returned from a charge."""
+    
+    id: str
+    amount: int
+    currency: str
+    status: str
+    customer: str
+
+
 class StripePaymentClient(PaymentClient):
     """
     Stripe implementation of PaymentClient interface.
@@ -66,29 +76,14 @@ class StripePaymentClient(PaymentClient):
             },
         )
         
-        # Mock implementation for demo
-        # In production, this would call stripe.PaymentIntent.create()
         try:
-            provider_transaction_id = f"pi_{uuid.uuid4().hex[:24]}"
-            
-            logger.info(
-                "Stripe charge successful",
-                extra={
-                    "provider_transaction_id": provider_transaction_id,
-                    "amount_cents": amount_cents,
-                },
-            )
-            
-            return ChargeResult(
-                success=True,
-                provider_transaction_id=provider_transaction_id,
-                raw_response={
-                    "id": provider_transaction_id,
-                    "amount": amount_cents,
-                    "currency": currency.lower(),
-                    "status": "succeeded" if capture else "requires_capture",
-                    "customer": customer_id,
-                },
+            provider_transaction_id = await self._call_provider_api(
+                amount_cents=amount_cents,
+                currency=currency,
+                customer_id=customer_id,
+                description=description,
+                metadata=metadata,
+                capture=capture,
             )
         except Exception as e:
             logger.error(
@@ -100,6 +95,59 @@ class StripePaymentClient(PaymentClient):
                 error_code="STRIPE_ERROR",
                 error_message=str(e),
             )
+        
+        logger.info(
+            "Stripe charge successful",
+            extra={
+                "provider_transaction_id": provider_transaction_id,
+                "amount_cents": amount_cents,
+            },
+        )
+        
+        return self._build_success_response(
+            provider_transaction_id,
+            amount_cents=amount_cents,
+            currency=currency,
+            customer_id=customer_id,
+            capture=capture,
+        )
+    
+    async def _call_provider_api(self, **params: Any) -> str:
+        """
+        Send a charge request to the Stripe API.
+        
+        This is the only part of a charge that can fail, so it is the only
+        part wrapped in error handling.
+        
+        TODO(TEAM-PAYMENTS): Call stripe.PaymentIntent.create() here.
+        
+        Returns:
+            ID of the created PaymentIntent
+        """
+        # Mock implementation for demo
+        return f"pi_{uuid.uuid4().hex[:24]}"
+    
+    @staticmethod
+    def _build_success_response(
+        provider_transaction_id: str,
+        *,
+        amount_cents: int,
+        currency: str,
+        customer_id: str,
+        capture: bool,
+    ) -> ChargeResult:
+        """Build the result of a successful charge."""
+        return ChargeResult(
+            success=True,
+            provider_transaction_id=provider_transaction_id,
+            raw_response=StripeChargeRaw(
+                id=provider_transaction_id,
+                amount=amount_cents,
+                currency=currency.lower(),
+                status="succeeded" if capture else "requires_capture",
+                customer=customer_id,
+            ),
+        )
     
     async def capture(
         self,
@@ -6,8 +6,12 @@ and managing payments across different providers.
 """
 
 import logging
+from bisect import insort
+from collections import defaultdict
 from datetime import datetime
-from typing import Any, Optional
+from functools import lru_cache
+from itertools import count, islice
+from typing import Any, Callable, Iterator, Optional
 
 from payments.api.schemas.payments import (
     PaymentProvider,
@@ -22,7 +26,7 @@ from payments.errors import (
 )
 from payments.interfaces.payment_client import PaymentClient
 from payments.logging_config import get_logger
-from payments.models.payment import Payment, PaymentLegacy
+from payments.models.payment import Payment
 from payments.providers.paypal_client import PayPalPaymentClient
 from payments.providers.stripe_client import StripePaymentClient
 from payments.services.transaction_manager import TransactionManager
@@ -30,6 +34,26 @@ from payments.utils.headers import RequestContext
 
 logger = get_logger(__name__)
 
+# Secondary index entry of (created_at, insertion sequence, id); indexes are
+# kept sorted so the newest entry is last
+_IndexKey = tuple[datetime, int, str]
+
+_CANCELLABLE_STATUSES: frozenset[PaymentStatus] = frozenset({
+    PaymentStatus.PENDING,
+    PaymentStatus.AUTHORIZED,
+})
+
+_CLIENT_FACTORIES: dict[PaymentProvider, Callable[[], PaymentClient]] = {
+    PaymentProvider.STRIPE: StripePaymentClient,
+    PaymentProvider.PAYPAL: PayPalPaymentClient,
+}
+
+
+@lru_cache()
+def _default_client(provider: PaymentProvider) -> PaymentClient:
+    """Get the shared client for a provider, falling back to Stripe."""
+    return _CLIENT_FACTORIES.get(provider, StripePaymentClient)()
+
 
 class PaymentService:
     """
@@ -45,6 +69,7 @@ class PaymentService:
         payment_client: Optional[PaymentClient] = None,
     ):
         self._request_context = request_context
+        self._request_id = request_context.request_id if request_context else None
         self._payment_client = payment_client
         self._api_version = "v2"
         self._transaction_manager = TransactionManager()
@@ -52,6 +77,11 @@ class PaymentService:
         # In-memory storage for development
         # TODO(TEAM-PAYMENTS): Replace with database repository
         self._payments: dict[str, Payment] = {}
+        self._payments_by_legacy_id: dict[str, Payment] = {}
+        self._sequence = count()
+        self._all_sorted: list[_IndexKey] = []
+        self._by_customer: defaultdict[str, list[_IndexKey]] = defaultdict(list)
+        self._by_order: defaultdict[str, list[_IndexKey]] = defaultdict(list)
     
     def set_api_version(self, version: str) -> None:
         """Set the API version for response formatting."""
@@ -62,12 +92,7 @@ class PaymentService:
         if self._payment_client:
             return self._payment_client
         
-        if provider == PaymentProvider.STRIPE:
-            return StripePaymentClient()
-        elif provider == PaymentProvider.PAYPAL:
-            return PayPalPaymentClient()
-        else:
-            return StripePaymentClient()
+        return _default_client(provider)
     
     async def create_payment(
         self,
@@ -85,17 +110,18 @@ class PaymentService:
         
         Orchestrates the payment creation through the appropriate provider.
         """
-        logger.info(
-            "Creating payment",
-            extra={
-                "customer_id": customer_id,
-                "order_id": order_id,
-                "amount_cents": amount_cents,
-                "currency": currency,
-                "provider": provider.value,
-                "request_id": self._request_context.request_id if self._request_context else None,
-            },
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Creating payment",
+                extra={
+                    "customer_id": customer_id,
+                    "order_id": order_id,
+                    "amount_cents": amount_cents,
+                    "currency": currency,
+                    "provider": provider.value,
+                    "request_id": self._request_id,
+                },
+            )
         
         # Create payment model
         payment = Payment.create(
@@ -124,7 +150,7 @@ class PaymentService:
                 payment.capture()
             else:
                 payment.authorize(result.provider_transaction_id or "")
-            payment.provider_transaction_id = result.provider_transaction_id
+            payment.set_provider_transaction_id(result.provider_transaction_id)
         else:
             payment.fail()
             raise PaymentDeclinedError(
@@ -134,16 +160,17 @@ class PaymentService:
             )
         
         # Store payment
-        self._payments[payment.id] = payment
-        
-        logger.info(
-            "Payment created successfully",
-            extra={
-                "payment_id": payment.id,
-                "status": payment.status.value,
-                "provider_transaction_id": payment.provider_transaction_id,
-            },
-        )
+        self._store_payment(payment)
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Payment created successfully",
+                extra={
+                    "payment_id": payment.id,
+                    "status": payment.status.value,
+                    "provider_transaction_id": payment.provider_transaction_id,
+                },
+            )
         
         return self._to_response(payment)
     
@@ -185,7 +212,7 @@ class PaymentService:
         if not payment:
             raise PaymentNotFoundError(payment_id)
         
-        if payment.status not in (PaymentStatus.PENDING, PaymentStatus.AUTHORIZED):
+        if payment.status not in _CANCELLABLE_STATUSES:
             raise PaymentAlreadyProcessedError(payment_id, payment.status.value)
         
         client = self._get_client(payment.provider)
@@ -202,32 +229,64 @@ class PaymentService:
         limit: int = 20,
         offset: int = 0,
     ) -> list[PaymentResponse]:
-        """List payments with optional filtering."""
-        payments = list(self._payments.values())
+        """
+        List payments with optional filtering, newest first.
         
-        if customer_id:
-            payments = [p for p in payments if p.customer_id == customer_id]
-        if order_id:
-            payments = [p for p in payments if p.order_id == order_id]
+        Walks the smallest matching secondary index, so a page costs
+        O(offset + limit) rather than a scan and sort of every payment.
+        """
+        if customer_id and order_id:
+            by_customer = self._by_customer.get(customer_id, [])
+            by_order = self._by_order.get(order_id, [])
+            index = by_customer if len(by_customer) <= len(by_order) else by_order
+        elif customer_id:
+            index = self._by_customer.get(customer_id, [])
+        elif order_id:
+            index = self._by_order.get(order_id, [])
+        else:
+            index = self._all_sorted
         
-        # Sort by created_at descending
-        payments.sort(key=lambda p: p.created_at, reverse=True)
+        payments: Iterator[Payment] = (self._payments[pid] for _, _, pid in reversed(index))
+        if customer_id and order_id:
+            payments = (
+                p for p in payments
+                if p.customer_id == customer_id and p.order_id == order_id
+            )
         
         # Paginate
-        payments = payments[offset:offset + limit]
+        page = islice(payments, max(offset, 0), max(offset, 0) + max(limit, 0))
         
-        return [self._to_response(p) for p in payments]
+        return [self._to_response(p) for p in page]
+    
+    def _store_payment(self, payment: Payment) -> None:
+        """Store a payment and add it to the secondary indexes."""
+        self._payments[payment.id] = payment
+        self._payments_by_legacy_id[payment.legacy_id] = payment
+        
+        key = (payment.created_at, next(self._sequence), payment.id)
+        insort(self._all_sorted, key)
+        insort(self._by_customer[payment.customer_id], key)
+        insort(self._by_order[payment.order_id], key)
     
     def _to_response(self, payment: Payment) -> PaymentResponse:
-        """Convert Payment model to API response."""
-        return PaymentResponse(
+        """
+        Convert Payment model to API response.
+        
+        The Payment model is already validated, so the response is built
+        with model_construct() and cached on the payment until it next
+        changes.
+        """
+        if payment.cached_response is not None:
+            return payment.cached_response
+        
+        response = PaymentResponse.model_construct(
             id=payment.id,
-            status=payment.status,
+            status=PaymentStatus(payment.status),
             amount_cents=payment.amount_cents,
             currency=payment.currency,
             customer_id=payment.customer_id,
             order_id=payment.order_id,
-            provider=payment.provider,
+            provider=PaymentProvider(payment.provider),
             provider_transaction_id=payment.provider_transaction_id,
             captured_amount_cents=payment.captured_amount_cents,
             refunded_amount_cents=payment.refunded_amount_cents,
@@ -235,6 +294,8 @@ class PaymentService:
             created_at=payment.created_at,
             updated_at=payment.updated_at,
         )
+        payment.cached_response = response
+        return response
     
     # Legacy methods for v1 API
     # TODO(TEAM-PAYMENTS): Remove after v1 deprecation
@@ -269,44 +330,66 @@ class PaymentService:
         
         # Simulate processing
         payment.capture()
-        payment.provider_transaction_id = f"ch_{idempotency_hash[:16] if idempotency_hash else 'legacy'}"
+        payment.set_provider_transaction_id(
+            f"ch_{idempotency_hash[:16] if idempotency_hash else 'legacy'}"
+        )
         
-        self._payments[payment.id] = payment
+        self._store_payment(payment)
         
         return PaymentResponseV1(
-            payment_id=payment.id.replace("pay_", "PAY-").upper(),
+            payment_id=payment.legacy_id,
             status_code="COMPLETED",
             amount=amount,
             currency_code=currency_code,
             user_id=user_id,
             order_reference=order_reference,
             transaction_reference=payment.provider_transaction_id,
-            created=payment.created_at.isoformat(),
+            created=payment.created_at_iso,
         )
     
+    def _find_payment_legacy(self, payment_id: str) -> Payment:
+        """Look up a payment by legacy (PAY-...) or current ID."""
+        payment = self._payments_by_legacy_id.get(payment_id)
+        if payment is None:
+            # Handle legacy ID format
+            payment = self._payments.get(payment_id.lower().replace("pay-", "pay_"))
+        if not payment:
+            raise PaymentNotFoundError(payment_id)
+        
+        return payment
+    
     async def get_payment_legacy(self, payment_id: str) -> PaymentResponseV1:
         """
         Get payment using legacy v1 response format.
         
         TODO(TEAM-PAYMENTS): Remove after v1 deprecation.
         """
-        # Handle legacy ID format
-        normalized_id = payment_id.lower().replace("pay-", "pay_")
+        payment = self._find_payment_legacy(payment_id)
         
-        payment = self._payments.get(normalized_id)
-        if not payment:
-            raise PaymentNotFoundError(payment_id)
+        return self._build_legacy_response(payment)
+    
+    def _build_legacy_response(self, payment: Payment) -> PaymentResponseV1:
+        """
+        Convert Payment model to legacy v1 API response.
         
-        return PaymentResponseV1(
-            payment_id=payment.id.replace("pay_", "PAY-").upper(),
+        Built with model_construct() and cached on the payment until it
+        next changes.
+        """
+        if payment.cached_response_v1 is not None:
+            return payment.cached_response_v1
+        
+        response = PaymentResponseV1.model_construct(
+            payment_id=payment.legacy_id,
             status_code=payment.status.value.upper(),
             amount=payment.amount_cents,
             currency_code=payment.currency,
             user_id=payment.customer_id,
             order_reference=payment.order_id,
             transaction_reference=payment.provider_transaction_id,
-            created=payment.created_at.isoformat(),
+            created=payment.created_at_iso,
         )
+        payment.cached_response_v1 = response
+        return response
     
     async def capture_payment_legacy(
         self,
@@ -314,24 +397,16 @@ class PaymentService:
         amount: Optional[int] = None,
     ) -> PaymentResponseV1:
         """Capture payment with legacy response."""
-        normalized_id = payment_id.lower().replace("pay-", "pay_")
-        
-        payment = self._payments.get(normalized_id)
-        if not payment:
-            raise PaymentNotFoundError(payment_id)
+        payment = self._find_payment_legacy(payment_id)
         
         payment.capture(amount)
         
-        return await self.get_payment_legacy(payment_id)
+        return self._build_legacy_response(payment)
     
     async def cancel_payment_legacy(self, payment_id: str) -> PaymentResponseV1:
         """Cancel payment with legacy response."""
-        normalized_id = payment_id.lower().replace("pay-", "pay_")
-        
-        payment = self._payments.get(normalized_id)
-        if not payment:
-            raise PaymentNotFoundError(payment_id)
+        payment = self._find_payment_legacy(payment_id)
         
         payment.cancel()
         
-        return await self.get_payment_legacy(payment_id)
+        return self._build_legacy_response(payment)
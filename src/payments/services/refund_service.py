@@ -5,8 +5,11 @@ This service handles the business logic for creating and managing refunds.
 """
 
 import logging
+from bisect import insort
+from collections import defaultdict
 from datetime import datetime
-from typing import Any, Optional
+from itertools import count, islice
+from typing import Any, Iterable, Optional
 
 from payments.api.schemas.refunds import (
     RefundReason,
@@ -21,12 +24,22 @@ from payments.errors import (
 )
 from payments.interfaces.payment_client import PaymentClient
 from payments.logging_config import get_logger
-from payments.models.refund import Refund, RefundLegacy
+from payments.models.refund import Refund
 from payments.providers.stripe_client import StripePaymentClient
 from payments.utils.headers import RequestContext
 
 logger = get_logger(__name__)
 
+# Secondary index entry of (created_at, insertion sequence, id); indexes are
+# kept sorted so the newest entry is last
+_IndexKey = tuple[datetime, int, str]
+
+# Legacy v1 reason codes; anything else maps to REQUESTED_BY_CUSTOMER
+_LEGACY_REASON_MAP: dict[str, RefundReason] = {
+    "DUPLICATE": RefundReason.DUPLICATE,
+    "FRAUD": RefundReason.FRAUDULENT,
+}
+
 
 class RefundService:
     """
@@ -42,12 +55,17 @@ class RefundService:
         payment_client: Optional[PaymentClient] = None,
     ):
         self._request_context = request_context
+        self._request_id = request_context.request_id if request_context else None
         self._payment_client = payment_client or StripePaymentClient()
         self._api_version = "v2"
         
         # In-memory storage for development
         # TODO(TEAM-PAYMENTS): Replace with database repository
         self._refunds: dict[str, Refund] = {}
+        self._refunds_by_legacy_id: dict[str, Refund] = {}
+        self._sequence = count()
+        self._all_sorted: list[_IndexKey] = []
+        self._by_payment: defaultdict[str, list[_IndexKey]] = defaultdict(list)
         
         # Mock payment data for testing
         self._mock_payments: dict[str, dict] = {
@@ -77,22 +95,27 @@ class RefundService:
         
         If amount_cents is not provided, creates a full refund.
         """
-        logger.info(
-            "Creating refund",
-            extra={
-                "payment_id": payment_id,
-                "amount_cents": amount_cents,
-                "reason": reason.value,
-                "request_id": self._request_context.request_id if self._request_context else None,
-            },
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Creating refund",
+                extra={
+                    "payment_id": payment_id,
+                    "amount_cents": amount_cents,
+                    "reason": reason.value,
+                    "request_id": self._request_id,
+                },
+            )
         
         # Get payment (mock for demo)
         payment = self._mock_payments.get(payment_id)
         if not payment:
             raise PaymentNotFoundError(payment_id)
         
-        available_refund = payment["amount_cents"] - payment.get("refunded_amount_cents", 0)
+        refunded_so_far = payment.get("refunded_amount_cents", 0)
+        currency = payment.get("currency", "USD")
+        provider_transaction_id = payment.get("provider_transaction_id", "")
+        
+        available_refund = payment["amount_cents"] - refunded_so_far
         refund_amount = amount_cents or available_refund
         
         if refund_amount > available_refund:
@@ -106,7 +129,7 @@ class RefundService:
         refund = Refund.create(
             payment_id=payment_id,
             amount_cents=refund_amount,
-            currency=payment.get("currency", "USD"),
+            currency=currency,
             reason=reason,
             notes=notes,
             metadata=metadata,
@@ -114,7 +137,7 @@ class RefundService:
         
         # Process refund through provider
         result = await self._payment_client.refund(
-            provider_transaction_id=payment.get("provider_transaction_id", ""),
+            provider_transaction_id=provider_transaction_id,
             amount_cents=refund_amount,
             reason=reason.value,
         )
@@ -123,22 +146,26 @@ class RefundService:
             refund.process(result.provider_refund_id or "")
             refund.complete()
             
-            # Update mock payment
-            payment["refunded_amount_cents"] = payment.get("refunded_amount_cents", 0) + refund_amount
+            # Update mock payment; re-read the total since other refunds may
+            # have completed while the provider call was awaited
+            payment["refunded_amount_cents"] = (
+                payment.get("refunded_amount_cents", 0) + refund_amount
+            )
         else:
             refund.fail()
         
         # Store refund
-        self._refunds[refund.id] = refund
-        
-        logger.info(
-            "Refund created successfully",
-            extra={
-                "refund_id": refund.id,
-                "status": refund.status.value,
-                "provider_refund_id": refund.provider_refund_id,
-            },
-        )
+        self._store_refund(refund)
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Refund created successfully",
+                extra={
+                    "refund_id": refund.id,
+                    "status": refund.status.value,
+                    "provider_refund_id": refund.provider_refund_id,
+                },
+            )
         
         return self._to_response(refund)
     
@@ -173,35 +200,54 @@ class RefundService:
         limit: int = 20,
         offset: int = 0,
     ) -> list[RefundResponse]:
-        """List refunds with optional filtering."""
-        refunds = list(self._refunds.values())
-        
-        if payment_id:
-            refunds = [r for r in refunds if r.payment_id == payment_id]
+        """
+        List refunds with optional filtering, newest first.
         
-        # Sort by created_at descending
-        refunds.sort(key=lambda r: r.created_at, reverse=True)
+        Walks the payment's secondary index when filtering, so a page costs
+        O(offset + limit) rather than a scan and sort of every refund.
+        """
+        index = self._by_payment.get(payment_id, []) if payment_id else self._all_sorted
         
         # Paginate
-        refunds = refunds[offset:offset + limit]
+        page = islice(reversed(index), max(offset, 0), max(offset, 0) + max(limit, 0))
+        
+        return [self._to_response(self._refunds[rid]) for _, _, rid in page]
+    
+    def _store_refund(self, refund: Refund) -> None:
+        """Store a refund and add it to the secondary indexes."""
+        self._refunds[refund.id] = refund
+        self._refunds_by_legacy_id[refund.legacy_id] = refund
         
-        return [self._to_response(r) for r in refunds]
+        key = (refund.created_at, next(self._sequence), refund.id)
+        insort(self._all_sorted, key)
+        insort(self._by_payment[refund.payment_id], key)
     
     def _to_response(self, refund: Refund) -> RefundResponse:
-        """Convert Refund model to API response."""
-        return RefundResponse(
+        """
+        Convert Refund model to API response.
+        
+        The Refund model is already validated, so the response is built
+        with model_construct() and cached on the refund until it next
+        changes.
+        """
+        if refund.cached_response is not None:
+            return refund.cached_response
+        
+        response = RefundResponse.model_construct(
             id=refund.id,
             payment_id=refund.payment_id,
-            status=refund.status,
+            status=RefundStatus(refund.status),
             amount_cents=refund.amount_cents,
             currency=refund.currency,
-            reason=refund.reason,
+            reason=RefundReason(refund.reason),
             provider_refund_id=refund.provider_refund_id,
             notes=refund.notes,
             metadata=refund.metadata,
             created_at=refund.created_at,
             updated_at=refund.updated_at,
         )
+        refund.cached_response = response
+        return response
     
     # Legacy methods for v1 API
     # TODO(TEAM-PAYMENTS): Remove after v1 deprecation
@@ -222,11 +268,7 @@ class RefundService:
         logging.info("Legacy refund processing for payment: %s", payment_reference)
         
         # Map legacy reason code
-        reason = RefundReason.REQUESTED_BY_CUSTOMER
-        if reason_code == "DUPLICATE":
-            reason = RefundReason.DUPLICATE
-        elif reason_code == "FRAUD":
-            reason = RefundReason.FRAUDULENT
+        reason = _LEGACY_REASON_MAP.get(reason_code or "", RefundReason.REQUESTED_BY_CUSTOMER)
         
         # Normalize payment reference
         payment_id = payment_reference.lower().replace("pay-", "pay_")
@@ -242,16 +284,16 @@ class RefundService:
         refund.process(f"re_legacy_{reference_hash[:8] if reference_hash else 'demo'}")
         refund.complete()
         
-        self._refunds[refund.id] = refund
+        self._store_refund(refund)
         
         return RefundResponseV1(
-            refund_id=refund.id.replace("ref_", "REF-").upper(),
+            refund_id=refund.legacy_id,
             payment_reference=payment_reference,
             status_code="REFUNDED",
             refund_amount=refund.amount_cents,
             currency_code=refund.currency,
             reason_code=reason_code,
-            created=refund.created_at.isoformat(),
+            created=refund.created_at_iso,
         )
     
     async def get_refund_legacy(self, refund_id: str) -> RefundResponseV1:
@@ -260,46 +302,48 @@ class RefundService:
         
         TODO(TEAM-PAYMENTS): Remove after v1 deprecation.
         """
-        # Handle legacy ID format
-        normalized_id = refund_id.lower().replace("ref-", "ref_")
-        
-        refund = self._refunds.get(normalized_id)
+        refund = self._refunds_by_legacy_id.get(refund_id)
+        if refund is None:
+            # Handle legacy ID format
+            refund = self._refunds.get(refund_id.lower().replace("ref-", "ref_"))
         if not refund:
             raise RefundNotFoundError(refund_id)
         
-        return RefundResponseV1(
-            refund_id=refund.id.replace("ref_", "REF-").upper(),
-            payment_reference=refund.payment_id.replace("pay_", "PAY-").upper(),
+        return self._build_legacy_response(refund)
+    
+    def _build_legacy_response(self, refund: Refund) -> RefundResponseV1:
+        """
+        Convert Refund model to legacy v1 API response.
+        
+        Built with model_construct() and cached on the refund until it
+        next changes.
+        """
+        if refund.cached_response_v1 is not None:
+            return refund.cached_response_v1
+        
+        response = RefundResponseV1.model_construct(
+            refund_id=refund.legacy_id,
+            payment_reference=refund.legacy_payment_id,
             status_code=refund.status.value.upper(),
             refund_amount=refund.amount_cents,
             currency_code=refund.currency,
             reason_code=refund.reason.value.upper(),
-            created=refund.created_at.isoformat(),
+            created=refund.created_at_iso,
         )
+        refund.cached_response_v1 = response
+        return response
     
     async def list_refunds_legacy(
         self,
         payment_reference: Optional[str] = None,
         limit: int = 20,
     ) -> list[RefundResponseV1]:
-        """List refunds with legacy response format."""
-        refunds = list(self._refunds.values())
-        
+        """List refunds with legacy response format, oldest first."""
+        refunds: Iterable[Refund]
         if payment_reference:
             payment_id = payment_reference.lower().replace("pay-", "pay_")
-            refunds = [r for r in refunds if r.payment_id == payment_id]
-        
-        refunds = refunds[:limit]
-        
-        return [
-            RefundResponseV1(
-                refund_id=r.id.replace("ref_", "REF-").upper(),
-                payment_reference=r.payment_id.replace("pay_", "PAY-").upper(),
-                status_code=r.status.value.upper(),
-                refund_amount=r.amount_cents,
-                currency_code=r.currency,
-                reason_code=r.reason.value.upper(),
-                created=r.created_at.isoformat(),
-            )
-            for r in refunds
-        ]
+            refunds = (self._refunds[rid] for _, _, rid in self._by_payment.get(payment_id, []))
+        else:
+            refunds = self._refunds.values()
+        
+        return [self._build_legacy_response(r) for r in islice(refunds, max(limit, 0))]
@@ -6,45 +6,90 @@ data consistency across payment operations.
 """
 
 import logging
-from contextlib import contextmanager
+import time
+from collections import deque
+from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum
-from typing import Any, Generator, Optional
-import uuid
+from enum import IntEnum
+from types import TracebackType
+from typing import Any, Callable, Optional
+import secrets
 
+from payments import _clock
 from payments.logging_config import get_logger
 from payments.models.transaction import Transaction, TransactionLog, TransactionType
 
 logger = get_logger(__name__)
 
+# Active transaction per manager, scoped per thread / asyncio task so that
+# concurrent callers each see their own transaction and begin() needs no
+# lock. ContextVars must live at module level (contexts keep strong
+# references to every var set in them), so managers share this one. The
+# dict is never mutated in place: each change sets a new one, so copies of
+# the context taken by child tasks are unaffected.
+_current_transactions: ContextVar[dict["TransactionManager", "TransactionContext"]] = (
+    ContextVar("current_transactions", default={})
+)
 
-class TransactionState(str, Enum):
-    """Transaction state for the manager."""
-    IDLE = "idle"
-    ACTIVE = "active"
-    COMMITTED = "committed"
-    ROLLED_BACK = "rolled_back"
+
+class TransactionState(IntEnum):
+    """
+    Transaction state for the manager.
+    
+    Integer-valued so state checks are int compares; str() gives the
+    lowercase name used when serializing.
+    """
+    IDLE = 0
+    ACTIVE = 1
+    COMMITTED = 2
+    ROLLED_BACK = 3
+    
+    def __str__(self) -> str:
+        """Return the lowercase state name, e.g. "rolled_back"."""
+        return self.name.lower()
 
 
-@dataclass
+@dataclass(slots=True)
 class TransactionContext:
     """Context for an active transaction."""
     
     id: str
     state: TransactionState
-    started_at: datetime
-    operations: list[dict[str, Any]]
+    started_at_ns: int
+    # (operation type, data, epoch nanoseconds) per recorded operation
+    operations: list[tuple[str, dict[str, Any], int]]
     
     @classmethod
     def create(cls) -> "TransactionContext":
         """Create a new transaction context."""
         return cls(
-            id=f"txn_ctx_{uuid.uuid4().hex[:12]}",
+            id=f"txn_ctx_{secrets.token_hex(6)}",
             state=TransactionState.ACTIVE,
-            started_at=datetime.utcnow(),
+            started_at_ns=time.time_ns(),
             operations=[],
         )
+    
+    @property
+    def started_at(self) -> datetime:
+        """Start time as a naive UTC datetime."""
+        return _clock.from_epoch_ns(self.started_at_ns)
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary, formatting timestamps as ISO strings."""
+        return {
+            "id": self.id,
+            "state": str(self.state),
+            "started_at": self.started_at.isoformat(),
+            "operations": [
+                {
+                    "type": op_type,
+                    "data": data,
+                    "timestamp": _clock.from_epoch_ns(ts_ns).isoformat(),
+                }
+                for op_type, data, ts_ns in self.operations
+            ],
+        }
 
 
 class TransactionManager:
@@ -57,17 +102,40 @@ class TransactionManager:
     TODO(TEAM-PAYMENTS): Integrate with real database transactions.
     """
     
-    def __init__(self):
-        self._current_transaction: Optional[TransactionContext] = None
-        self._transaction_logs: list[TransactionLog] = []
+    def __init__(
+        self,
+        max_logs: int = 10_000,
+        log_sink: Optional[Callable[[TransactionLog], None]] = None,
+    ):
+        # Only the most recent logs are kept in memory; pass log_sink to
+        # receive every entry, e.g. to ship them somewhere durable
+        self._transaction_logs: deque[TransactionLog] = deque(maxlen=max_logs)
+        self._log_sink = log_sink
+    
+    def _active_transaction(self) -> Optional[TransactionContext]:
+        """Get the caller's transaction if it is still active."""
+        txn = _current_transactions.get().get(self)
+        if txn is not None and txn.state == TransactionState.ACTIVE:
+            return txn
+        return None
+    
+    def _set_current_transaction(self, txn: Optional[TransactionContext]) -> None:
+        """Set or clear the caller's transaction for this manager."""
+        current = _current_transactions.get()
+        if txn is not None:
+            _current_transactions.set({**current, self: txn})
+        elif self in current:
+            _current_transactions.set({m: t for m, t in current.items() if m is not self})
     
     @property
     def in_transaction(self) -> bool:
         """Check if a transaction is active."""
-        return (
-            self._current_transaction is not None
-            and self._current_transaction.state == TransactionState.ACTIVE
-        )
+        return self._active_transaction() is not None
+    
+    @property
+    def transaction_logs(self) -> list[TransactionLog]:
+        """Get the retained transaction logs, oldest first."""
+        return list(self._transaction_logs)
     
     def begin(self) -> TransactionContext:
         """
@@ -78,14 +146,16 @@ class TransactionManager:
         if self.in_transaction:
             raise RuntimeError("Transaction already in progress")
         
-        self._current_transaction = TransactionContext.create()
+        txn = TransactionContext.create()
+        self._set_current_transaction(txn)
         
-        logger.info(
-            "Transaction started",
-            extra={"transaction_id": self._current_transaction.id},
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Transaction started",
+                extra={"transaction_id": txn.id},
+            )
         
-        return self._current_transaction
+        return txn
     
     def commit(self) -> None:
         """
@@ -93,27 +163,27 @@ class TransactionManager:
         
         Raises if no transaction is active.
         """
-        if not self.in_transaction:
+        txn = self._active_transaction()
+        if txn is None:
             raise RuntimeError("No active transaction to commit")
         
-        assert self._current_transaction is not None
-        
-        self._current_transaction.state = TransactionState.COMMITTED
+        txn.state = TransactionState.COMMITTED
         
         # Log commit
-        self._log_event(self._current_transaction.id, "COMMITTED", {
-            "operations_count": len(self._current_transaction.operations),
+        self._log_event(txn.id, "COMMITTED", {
+            "operations_count": len(txn.operations),
         })
         
-        logger.info(
-            "Transaction committed",
-            extra={
-                "transaction_id": self._current_transaction.id,
-                "operations": len(self._current_transaction.operations),
-            },
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Transaction committed",
+                extra={
+                    "transaction_id": txn.id,
+                    "operations": len(txn.operations),
+                },
+            )
         
-        self._current_transaction = None
+        self._set_current_transaction(None)
     
     def rollback(self, reason: Optional[str] = None) -> None:
         """
@@ -121,29 +191,29 @@ class TransactionManager:
         
         Raises if no transaction is active.
         """
-        if not self.in_transaction:
+        txn = self._active_transaction()
+        if txn is None:
             raise RuntimeError("No active transaction to rollback")
         
-        assert self._current_transaction is not None
-        
-        self._current_transaction.state = TransactionState.ROLLED_BACK
+        txn.state = TransactionState.ROLLED_BACK
         
         # Log rollback
-        self._log_event(self._current_transaction.id, "ROLLED_BACK", {
+        self._log_event(txn.id, "ROLLED_BACK", {
             "reason": reason,
-            "operations_count": len(self._current_transaction.operations),
+            "operations_count": len(txn.operations),
         })
         
-        logger.warning(
-            "Transaction rolled back",
-            extra={
-                "transaction_id": self._current_transaction.id,
-                "reason": reason,
-                "operations": len(self._current_transaction.operations),
-            },
-        )
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Transaction rolled back",
+                extra={
+                    "transaction_id": txn.id,
+                    "reason": reason,
+                    "operations": len(txn.operations),
+                },
+            )
         
-        self._current_transaction = None
+        self._set_current_transaction(None)
     
     def record_operation(
         self,
@@ -151,24 +221,19 @@ class TransactionManager:
         data: dict[str, Any],
     ) -> None:
         """Record an operation within the current transaction."""
-        if not self.in_transaction:
+        txn = self._active_transaction()
+        if txn is None:
             # Log but don't fail for operations outside transactions
-            logger.warning(
-                "Operation recorded outside transaction",
-                extra={"operation_type": operation_type},
-            )
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "Operation recorded outside transaction",
+                    extra={"operation_type": operation_type},
+                )
             return
         
-        assert self._current_transaction is not None
-        
-        self._current_transaction.operations.append({
-            "type": operation_type,
-            "data": data,
-            "timestamp": datetime.utcnow().isoformat(),
-        })
+        txn.operations.append((operation_type, data, time.time_ns()))
     
-    @contextmanager
-    def transaction(self) -> Generator[TransactionContext, None, None]:
+    def transaction(self) -> "_TxnScope":
         """
         Context manager for transactions.
         
@@ -179,13 +244,7 @@ class TransactionManager:
                 # perform operations
                 pass
         """
-        ctx = self.begin()
-        try:
-            yield ctx
-            self.commit()
-        except Exception as e:
-            self.rollback(reason=str(e))
-            raise
+        return _TxnScope(self)
     
     def _log_event(
         self,
@@ -196,6 +255,34 @@ class TransactionManager:
         """Log a transaction event."""
         log = TransactionLog.log_event(transaction_id, event, data)
         self._transaction_logs.append(log)
+        if self._log_sink is not None:
+            self._log_sink(log)
+
+
+class _TxnScope:
+    """Class-based context manager behind TransactionManager.transaction()."""
+    
+    __slots__ = ("_manager", "ctx")
+    
+    def __init__(self, manager: TransactionManager):
+        self._manager = manager
+    
+    def __enter__(self) -> TransactionContext:
+        """Begin the transaction."""
+        self.ctx = self._manager.begin()
+        return self.ctx
+    
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        """Commit on success, roll back on any exception, and re-raise it."""
+        if exc_type is None:
+            self._manager.commit()
+        else:
+            self._manager.rollback(reason=str(exc))
 
 
 class LegacyTransactionManager:
@@ -220,7 +307,7 @@ class LegacyTransactionManager:
         logging.info("Starting legacy transaction")
         
         self._active = True
-        return f"legacy_txn_{uuid.uuid4().hex[:8]}"
+        return f"legacy_txn_{secrets.token_hex(4)}"
     
     def commit_transaction(self, transaction_id: str) -> bool:
         """
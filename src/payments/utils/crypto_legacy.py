@@ -9,6 +9,7 @@ TODO(TEAM-SEC): Replace all MD5/SHA1 usage with secure alternatives.
 
 import hashlib
 import hmac
+from functools import lru_cache
 from typing import Union
 
 
@@ -72,6 +73,86 @@ def compute_sha256(data: Union[str, bytes]) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
+def compute_md5_bytes(data: bytes) -> str:
+    """
+    Compute MD5 hash of bytes without type dispatch.
+    
+    ⚠️ DEPRECATED: MD5 is cryptographically broken. See compute_md5().
+    """
+    return hashlib.md5(data).hexdigest()
+
+
+def compute_sha1_bytes(data: bytes) -> str:
+    """
+    Compute SHA1 hash of bytes without type dispatch.
+    
+    ⚠️ DEPRECATED: SHA1 is cryptographically weak. See compute_sha1().
+    """
+    return hashlib.sha1(data).hexdigest()
+
+
+def compute_sha256_bytes(data: bytes) -> str:
+    """Compute SHA256 hash of bytes without type dispatch."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class WebhookVerifier:
+    """
+    HMAC signature verifier bound to one webhook signing secret.
+    
+    Encodes the secret once and keys an HMAC object per algorithm on first
+    use; each verification copies it, so only the payload is hashed. Get
+    instances from get_webhook_verifier() to share them per secret.
+    """
+    
+    __slots__ = ("_key", "_macs")
+    
+    def __init__(self, secret: str):
+        self._key = secret.encode("utf-8")
+        self._macs: dict[str, hmac.HMAC] = {}
+    
+    def _hexdigest(self, data: bytes, digestmod: str) -> str:
+        """Compute an HMAC hex digest from a copy of the keyed HMAC object."""
+        keyed = self._macs.get(digestmod)
+        if keyed is None:
+            keyed = self._macs[digestmod] = hmac.new(self._key, digestmod=digestmod)
+        
+        mac = keyed.copy()
+        mac.update(data)
+        return mac.hexdigest()
+    
+    def verify_sha256(self, data: bytes, expected_signature: str) -> bool:
+        """Verify an HMAC-SHA256 signature in constant time."""
+        return hmac.compare_digest(self._hexdigest(data, "sha256"), expected_signature)
+    
+    def verify_md5(self, data: bytes, expected_signature: str) -> bool:
+        """
+        Verify an HMAC-MD5 signature in constant time.
+        
+        ⚠️ DEPRECATED: MD5 is cryptographically broken.
+        
+        TODO(TEAM-SEC): Remove after all clients migrate to SHA-256.
+        """
+        return hmac.compare_digest(self._hexdigest(data, "md5"), expected_signature)
+
+
+@lru_cache(maxsize=32)
+def get_webhook_verifier(secret: str) -> WebhookVerifier:
+    """
+    Get the shared verifier for a signing secret.
+    
+    Verifiers are cached by secret value: only pass long-lived signing
+    secrets, never attacker-controlled strings.
+    
+    Args:
+        secret: Secret key used for signing
+        
+    Returns:
+        WebhookVerifier for the secret
+    """
+    return WebhookVerifier(secret)
+
+
 # SEC-130: SHA256 HMAC validation added alongside legacy MD5 (2022-09)
 def verify_hmac_sha256(
     data: bytes,
@@ -91,13 +172,7 @@ def verify_hmac_sha256(
     Returns:
         True if signature is valid, False otherwise
     """
-    computed = hmac.new(
-        secret.encode("utf-8"),
-        data,
-        hashlib.sha256,
-    ).hexdigest()
-    
-    return hmac.compare_digest(computed, expected_signature)
+    return get_webhook_verifier(secret).verify_sha256(data, expected_signature)
 
 
 # SEC-101: Initial MD5 signature validation for payment webhooks (2022-03)
@@ -121,13 +196,7 @@ def verify_hmac_md5(
     Returns:
         True if signature is valid, False otherwise
     """
-    computed = hmac.new(
-        secret.encode("utf-8"),
-        data,
-        hashlib.md5,
-    ).hexdigest()
-    
-    return hmac.compare_digest(computed, expected_signature)
+    return get_webhook_verifier(secret).verify_md5(data, expected_signature)
 
 
 def generate_idempotency_key(
@@ -151,7 +220,7 @@ def generate_idempotency_key(
     # Legacy implementation using MD5
     # TODO(TEAM-SEC): Replace MD5 with SHA-256
     data = f"{user_id}:{order_id}:{amount_cents}"
-    return compute_md5(data)
+    return compute_md5_bytes(data.encode("utf-8"))
 
 
 def hash_card_fingerprint(last_four: str, exp_month: int, exp_year: int) -> str:
@@ -171,7 +240,7 @@ def hash_card_fingerprint(last_four: str, exp_month: int, exp_year: int) -> str:
         Card fingerprint hash
     """
     data = f"{last_four}:{exp_month:02d}:{exp_year}"
-    return compute_sha1(data)
+    return compute_sha1_bytes(data.encode("utf-8"))
 
 
 # SEC-160: DEPRECATED - MD5 signature validation scheduled for removal
@@ -205,4 +274,4 @@ class LegacyCryptoHelper:
         
         TODO(TEAM-SEC): Migrate to HMAC-SHA256.
         """
-        return verify_hmac_md5(payload, secret, signature)
+        return get_webhook_verifier(secret).verify_md5(payload, signature)
@@ -7,13 +7,29 @@ Handles the extraction and management of request headers including:
 - X-User-Id: Current user identifier header
 """
 
+import sys
 from dataclasses import dataclass
 from typing import Optional
 
 from fastapi import Request
 
+_REQUEST_ID_HEADER = sys.intern("X-Acme-Request-ID")
+_USER_ID_HEADER = sys.intern("X-User-Id")
+_LEGACY_USER_ID_HEADER = sys.intern("X-Legacy-User-Id")
 
-@dataclass
+_REQUEST_ID_HEADER_BYTES = _REQUEST_ID_HEADER.encode("ascii")
+_USER_ID_HEADER_BYTES = _USER_ID_HEADER.encode("ascii")
+_LEGACY_USER_ID_HEADER_BYTES = _LEGACY_USER_ID_HEADER.encode("ascii")
+
+# Raw (lowercased) ASGI header name -> RequestContext field
+_CONTEXT_HEADER_FIELDS: dict[bytes, str] = {
+    b"x-acme-request-id": "request_id",
+    b"x-user-id": "user_id",
+    b"x-legacy-user-id": "legacy_user_id",
+}
+
+
+@dataclass(slots=True)
 class RequestContext:
     """
     Request context extracted from HTTP headers.
@@ -63,11 +79,15 @@ def parse_request_context(request: Request) -> RequestContext:
     Returns:
         RequestContext with extracted header values
     """
-    return RequestContext(
-        request_id=request.headers.get("X-Acme-Request-ID"),
-        user_id=request.headers.get("X-User-Id"),
-        legacy_user_id=request.headers.get("X-Legacy-User-Id"),
-    )
+    # Single pass over the raw header list; the first occurrence of a
+    # repeated header wins, as with request.headers.get()
+    values: dict[str, str] = {}
+    for name, value in request.scope["headers"]:
+        field = _CONTEXT_HEADER_FIELDS.get(name)
+        if field is not None and field not in values:
+            values[field] = value.decode("latin-1")
+    
+    return RequestContext(**values)
 
 
 def get_request_id(request: Request) -> Optional[str]:
@@ -128,14 +148,70 @@ def build_outbound_headers(context: RequestContext) -> dict[str, str]:
     headers: dict[str, str] = {}
     
     if context.request_id:
-        headers["X-Acme-Request-ID"] = context.request_id
+        headers[_REQUEST_ID_HEADER] = context.request_id
+    
+    if context.user_id:
+        headers[_USER_ID_HEADER] = context.user_id
+    
+    # TODO(TEAM-API): Stop propagating X-Legacy-User-Id after migration
+    if context.legacy_user_id:
+        headers[_LEGACY_USER_ID_HEADER] = context.legacy_user_id
+    
+    return headers
+
+
+def _first_by_priority(request: Request, names: tuple[bytes, ...]) -> Optional[str]:
+    """
+    Get the value of the highest-priority non-empty header.
+    
+    Scans the raw header list once instead of looking up each candidate.
+    
+    Args:
+        request: FastAPI Request object
+        names: Raw (lowercased) header names, highest priority first
+        
+    Returns:
+        Header value or None if no candidate is present
+    """
+    best_rank = len(names)
+    best_value: Optional[bytes] = None
+    for name, value in request.scope["headers"]:
+        if value and name in names:
+            rank = names.index(name)
+            if rank < best_rank:
+                best_rank, best_value = rank, value
+                if rank == 0:
+                    break
+    
+    return best_value.decode("latin-1") if best_value is not None else None
+
+
+def build_outbound_headers_bytes(context: RequestContext) -> list[tuple[bytes, bytes]]:
+    """
+    Build pre-encoded headers for outbound requests to other services.
+    
+    Same headers as build_outbound_headers(), but as raw (name, value)
+    pairs that httpx accepts without re-encoding.
+    
+    Args:
+        context: Current request context
+        
+    Returns:
+        List of (name, value) byte pairs to include in outbound requests
+    """
+    headers: list[tuple[bytes, bytes]] = []
+    
+    if context.request_id:
+        headers.append((_REQUEST_ID_HEADER_BYTES, context.request_id.encode("latin-1")))
     
     if context.user_id:
-        headers["X-User-Id"] = context.user_id
+        headers.append((_USER_ID_HEADER_BYTES, context.user_id.encode("latin-1")))
     
     # TODO(TEAM-API): Stop propagating X-Legacy-User-Id after migration
     if context.legacy_user_id:
-        headers["X-Legacy-User-Id"] = context.legacy_user_id
+        headers.append(
+            (_LEGACY_USER_ID_HEADER_BYTES, context.legacy_user_id.encode("latin-1"))
+        )
     
     return headers
 
@@ -147,6 +223,20 @@ class LegacyHeaderParser:
     TODO(TEAM-API): Remove after v1 deprecation.
     """
     
+    # Candidate header names, highest priority first
+    # TODO(TEAM-API): Remove the fallbacks after migration
+    USER_ID_HEADERS = (
+        b"x-user-id",
+        b"x-legacy-user-id",
+        b"x-userid",  # Very old format
+        b"userid",  # Even older format
+    )
+    CORRELATION_ID_HEADERS = (
+        b"x-acme-request-id",
+        b"x-request-id",  # Alternative format
+        b"x-correlation-id",  # Legacy format
+    )
+    
     @staticmethod
     def parse_user_id(request: Request) -> Optional[str]:
         """
@@ -154,26 +244,11 @@ class LegacyHeaderParser:
         
         Supports older header names that may still be in use.
         """
-        # Try new header first
-        user_id = request.headers.get("X-User-Id")
-        if user_id:
-            return user_id
-        
-        # Fall back to legacy headers
-        # TODO(TEAM-API): Remove these fallbacks after migration
-        return (
-            request.headers.get("X-Legacy-User-Id")
-            or request.headers.get("X-UserId")  # Very old format
-            or request.headers.get("UserId")  # Even older format
-        )
+        return _first_by_priority(request, LegacyHeaderParser.USER_ID_HEADERS)
     
     @staticmethod
     def parse_correlation_id(request: Request) -> Optional[str]:
         """
         Parse correlation ID using legacy header names.
         """
-        return (
-            request.headers.get("X-Acme-Request-ID")
-            or request.headers.get("X-Request-ID")  # Alternative format
-            or request.headers.get("X-Correlation-ID")  # Legacy format
-        )
+        return _first_by_priority(request, LegacyHeaderParser.CORRELATION_ID_HEADERS)
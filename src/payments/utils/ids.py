@@ -0,0 +1,26 @@
+"""
+Identifier generation utilities.
+
+Provider-style identifiers (e.g. ``ORDER-3F9A0C1B2D4E5F60``) are a fixed
+ASCII prefix followed by uppercase hex entropy.
+"""
+
+import binascii
+import os
+
+
+def prefixed_id(prefix: bytes, n: int = 8) -> str:
+    """
+    Generate an identifier with a fixed prefix and an uppercase hex suffix.
+    
+    Builds the whole identifier as bytes and decodes it once, instead of
+    formatting a UUID and slicing/uppercasing the resulting string.
+    
+    Args:
+        prefix: ASCII prefix (e.g. b"ORDER-")
+        n: Number of random bytes; the suffix has 2 * n hex characters
+        
+    Returns:
+        Identifier string
+    """
+    return (prefix + binascii.hexlify(os.urandom(n)).upper()).decode("ascii")
@@ -12,10 +12,12 @@ from payments.errors import ValidationError
 
 
 # ISO 4217 currency codes (common subset)
-VALID_CURRENCY_CODES = {
+VALID_CURRENCY_CODES = frozenset({
     "USD", "EUR", "GBP", "JPY", "AUD", "CAD", "CHF", "CNY", "HKD", "NZD",
     "SEK", "KRW", "SGD", "NOK", "MXN", "INR", "RUB", "ZAR", "TRY", "BRL",
-}
+})
+
+CURRENCY_CODE_PATTERN = re.compile(r"[A-Z]{3}")
 
 # Regex patterns for ID validation
 PAYMENT_ID_PATTERN = re.compile(r"^pay_[a-f0-9]{16}$")
@@ -23,6 +25,11 @@ LEGACY_PAYMENT_ID_PATTERN = re.compile(r"^PAY-[A-F0-9]{16}$")
 REFUND_ID_PATTERN = re.compile(r"^ref_[a-f0-9]{16}$")
 LEGACY_REFUND_ID_PATTERN = re.compile(r"^REF-[A-F0-9]{16}$")
 
+# Modern and legacy formats in one pattern so validation is a single match
+# TODO(TEAM-API): Drop the legacy alternatives after v1 deprecation
+_PAYMENT_ID_ANY_PATTERN = re.compile(r"pay_[a-f0-9]{16}|PAY-[A-F0-9]{16}")
+_REFUND_ID_ANY_PATTERN = re.compile(r"ref_[a-f0-9]{16}|REF-[A-F0-9]{16}")
+
 
 def validate_currency_code(currency: str) -> str:
     """
@@ -37,13 +44,10 @@ def validate_currency_code(currency: str) -> str:
     Raises:
         ValidationError: If currency code is invalid
     """
-    normalized = currency.upper().strip()
+    normalized = currency.strip().upper()
     
-    if len(normalized) != 3:
-        raise ValidationError("currency", "Currency code must be 3 characters")
-    
-    if not normalized.isalpha():
-        raise ValidationError("currency", "Currency code must be alphabetic")
+    if not CURRENCY_CODE_PATTERN.fullmatch(normalized):
+        raise ValidationError("currency", "Currency code must be 3 letters (A-Z)")
     
     if normalized not in VALID_CURRENCY_CODES:
         # Warning but allow - might be a valid code we don't have in our list
@@ -101,11 +105,7 @@ def validate_payment_id(payment_id: str) -> str:
     if not payment_id:
         raise ValidationError("payment_id", "Payment ID is required")
     
-    if PAYMENT_ID_PATTERN.match(payment_id):
-        return payment_id
-    
-    # TODO(TEAM-API): Remove legacy format support after v1 deprecation
-    if LEGACY_PAYMENT_ID_PATTERN.match(payment_id):
+    if _PAYMENT_ID_ANY_PATTERN.fullmatch(payment_id):
         return payment_id
     
     raise ValidationError(
@@ -130,11 +130,7 @@ def validate_refund_id(refund_id: str) -> str:
     if not refund_id:
         raise ValidationError("refund_id", "Refund ID is required")
     
-    if REFUND_ID_PATTERN.match(refund_id):
-        return refund_id
-    
-    # TODO(TEAM-API): Remove legacy format support after v1 deprecation
-    if LEGACY_REFUND_ID_PATTERN.match(refund_id):
+    if _REFUND_ID_ANY_PATTERN.fullmatch(refund_id):
         return refund_id
     
     raise ValidationError(
@@ -1,59 +1,125 @@
 """Pytest configuration and fixtures."""
 
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import AsyncIterator, Iterator
+
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 
+from payments.api.dependencies import (
+    get_payment_service,
+    get_payment_service_legacy,
+    get_payment_service_v2,
+)
 from payments.main import app
+from payments.services.payment_service import PaymentService
+from tests.helpers import json_body
+from tests.payloads import (
+    SAMPLE_PAYMENT_REQUEST,
+    SAMPLE_PAYMENT_REQUEST_V1,
+    SAMPLE_REFUND_REQUEST,
+)
 
 
-@pytest.fixture
-def client() -> TestClient:
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
+@contextmanager
+def _serve_payments_from(service: PaymentService) -> Iterator[None]:
+    """Route every payment-service dependency to one PaymentService."""
+    dependencies = (get_payment_service, get_payment_service_v2, get_payment_service_legacy)
+    for dependency in dependencies:
+        app.dependency_overrides[dependency] = lambda: service
+    try:
+        yield
+    finally:
+        for dependency in dependencies:
+            app.dependency_overrides.pop(dependency, None)
 
 
-@pytest.fixture
-def sample_payment_request() -> dict:
-    """Sample payment request for testing."""
-    return {
-        "amount_cents": 9999,
-        "currency": "USD",
-        "customer_id": "cust_test123",
-        "order_id": "ord_test456",
-        "provider": "stripe",
-        "description": "Test payment",
-        "capture_immediately": True,
-    }
+@pytest.fixture(scope="module")
+def shared_payment_service() -> PaymentService:
+    """
+    PaymentService shared by the tests of one module.
+    
+    The app builds a service per request (api/dependencies.py), so it
+    cannot yet read back a payment created by an earlier request. Tests
+    that need to, e.g. to read the seeded_* payments, opt in with
+    use_shared_payment_service; all other tests go through the real
+    dependency wiring.
+    """
+    return PaymentService()
 
 
 @pytest.fixture
-def sample_payment_request_v1() -> dict:
-    """Sample v1 payment request for testing."""
-    return {
-        "amount": 9999,
-        "currency_code": "USD",
-        "user_id": "user_test123",
-        "order_reference": "ORD-TEST456",
-        "payment_method": "card",
-    }
+def use_shared_payment_service(
+    shared_payment_service: PaymentService,
+) -> Iterator[PaymentService]:
+    """
+    Serve this test's payment requests from the module's shared PaymentService.
+    
+    The service's stores and indexes are rolled back afterwards, so payments
+    the test creates do not leak into later tests; anything seeded before
+    the test (the module-scoped seeded_* fixtures) is kept. Payments are
+    copied shallowly, so tests should not mutate seeded payments.
+    """
+    service = shared_payment_service
+    payments = dict(service._payments)
+    payments_by_legacy_id = dict(service._payments_by_legacy_id)
+    all_sorted = list(service._all_sorted)
+    by_customer = {key: list(index) for key, index in service._by_customer.items()}
+    by_order = {key: list(index) for key, index in service._by_order.items()}
+    
+    with _serve_payments_from(service):
+        yield service
+    
+    service._payments = payments
+    service._payments_by_legacy_id = payments_by_legacy_id
+    service._all_sorted = all_sorted
+    service._by_customer = defaultdict(list, by_customer)
+    service._by_order = defaultdict(list, by_order)
 
 
-@pytest.fixture
-def sample_refund_request() -> dict:
-    """Sample refund request for testing."""
-    return {
-        "payment_id": "pay_demo123",
-        "amount_cents": 5000,
-        "reason": "requested_by_customer",
-        "notes": "Test refund",
-    }
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client() -> AsyncIterator[AsyncClient]:
+    """
+    Create an async test client for the FastAPI app.
+    
+    Requests are dispatched straight to the ASGI app on the test event loop
+    rather than through TestClient's thread portal. Shared across the
+    session so the lifespan and transport are set up once.
+    """
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://test",
+        ) as test_client:
+            yield test_client
 
 
-@pytest.fixture
-def sample_refund_request_v1() -> dict:
-    """Sample v1 refund request for testing."""
-    return {
-        "payment_reference": "PAY-DEMO123",
-        "refund_amount": 5000,
-        "reason_code": "CUSTOMER_REQUEST",
-    }
+@pytest_asyncio.fixture(scope="module")
+async def seeded_payment(
+    client: AsyncClient,
+    shared_payment_service: PaymentService,
+) -> dict:
+    """Payment created once per module in the shared PaymentService."""
+    with _serve_payments_from(shared_payment_service):
+        response = await client.post("/api/v2/payments", json=SAMPLE_PAYMENT_REQUEST)
+    return json_body(response)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def seeded_payment_v1(
+    client: AsyncClient,
+    shared_payment_service: PaymentService,
+) -> dict:
+    """v1 payment created once per module in the shared PaymentService."""
+    with _serve_payments_from(shared_payment_service):
+        response = await client.post("/api/v1/payments", json=SAMPLE_PAYMENT_REQUEST_V1)
+    return json_body(response)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def seeded_refund(client: AsyncClient) -> dict:
+    """Refund created once per module for read-only tests."""
+    response = await client.post("/api/v2/refunds", json=SAMPLE_REFUND_REQUEST)
+    return json_body(response)
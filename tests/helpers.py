@@ -0,0 +1,11 @@
+"""Shared helpers for the HTTP tests."""
+
+from typing import Any
+
+import orjson
+from httpx import Response
+
+
+def json_body(response: Response) -> Any:
+    """Decode a response body with orjson instead of the stdlib json module."""
+    return orjson.loads(response.content)
@@ -0,0 +1,36 @@
+"""Sample request payloads for the HTTP tests."""
+
+from typing import Any
+
+# Treat these as read-only; tests that need a variant build one with the |
+# operator, e.g. SAMPLE_PAYMENT_REQUEST | {"provider": "paypal"}
+SAMPLE_PAYMENT_REQUEST: dict[str, Any] = {
+    "amount_cents": 9999,
+    "currency": "USD",
+    "customer_id": "cust_test123",
+    "order_id": "ord_test456",
+    "provider": "stripe",
+    "description": "Test payment",
+    "capture_immediately": True,
+}
+
+SAMPLE_PAYMENT_REQUEST_V1: dict[str, Any] = {
+    "amount": 9999,
+    "currency_code": "USD",
+    "user_id": "user_test123",
+    "order_reference": "ORD-TEST456",
+    "payment_method": "card",
+}
+
+SAMPLE_REFUND_REQUEST: dict[str, Any] = {
+    "payment_id": "pay_demo123",
+    "amount_cents": 5000,
+    "reason": "requested_by_customer",
+    "notes": "Test refund",
+}
+
+SAMPLE_REFUND_REQUEST_V1: dict[str, Any] = {
+    "payment_reference": "PAY-DEMO123",
+    "refund_amount": 5000,
+    "reason_code": "CUSTOMER_REQUEST",
+}
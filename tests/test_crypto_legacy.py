@@ -1,14 +1,19 @@
 """Tests for legacy crypto utilities."""
 
+import hashlib
+import hmac
+
 import pytest
 
 from payments.utils.crypto_legacy import (
     compute_md5,
     compute_sha1,
     compute_sha256,
+    compute_sha256_bytes,
     verify_hmac_sha256,
     verify_hmac_md5,
     generate_idempotency_key,
+    get_webhook_verifier,
 )
 
 
@@ -45,14 +50,17 @@ def test_compute_sha256() -> None:
     assert result == "2cf24dba5fb0a30e26e83b2ac5b9e29e1b161e5c1fa7425e73043362938b9824"
 
 
+def test_compute_sha256_bytes() -> None:
+    """Test the bytes-only SHA256 variant matches compute_sha256."""
+    assert compute_sha256_bytes(b"hello") == compute_sha256("hello")
+
+
 def test_verify_hmac_sha256_valid() -> None:
     """Test HMAC-SHA256 verification with valid signature."""
     data = b"test data"
     secret = "secret_key"
     
     # Compute expected signature
-    import hmac
-    import hashlib
     expected = hmac.new(secret.encode(), data, hashlib.sha256).hexdigest()
     
     assert verify_hmac_sha256(data, secret, expected) is True
@@ -66,18 +74,41 @@ def test_verify_hmac_sha256_invalid() -> None:
     assert verify_hmac_sha256(data, secret, "invalid_signature") is False
 
 
+def test_verify_hmac_sha256_long_secret() -> None:
+    """Test HMAC-SHA256 with a secret longer than the hash block size."""
+    data = b"test data"
+    secret = "k" * 100
+    
+    expected = hmac.new(secret.encode(), data, hashlib.sha256).hexdigest()
+    
+    assert verify_hmac_sha256(data, secret, expected) is True
+    assert verify_hmac_sha256(data, secret, expected) is True
+
+
 def test_verify_hmac_md5() -> None:
     """Test legacy HMAC-MD5 verification."""
     data = b"test data"
     secret = "secret_key"
     
-    import hmac
-    import hashlib
     expected = hmac.new(secret.encode(), data, hashlib.md5).hexdigest()
     
     assert verify_hmac_md5(data, secret, expected) is True
 
 
+def test_webhook_verifier_shared_per_secret() -> None:
+    """Test verifiers are reused per secret and check both algorithms."""
+    data = b"test data"
+    verifier = get_webhook_verifier("secret_key")
+    
+    sha256 = hmac.new(b"secret_key", data, hashlib.sha256).hexdigest()
+    md5 = hmac.new(b"secret_key", data, hashlib.md5).hexdigest()
+    
+    assert get_webhook_verifier("secret_key") is verifier
+    assert verifier.verify_sha256(data, sha256) is True
+    assert verifier.verify_md5(data, md5) is True
+    assert verifier.verify_sha256(data, md5) is False
+
+
 def test_generate_idempotency_key() -> None:
     """Test idempotency key generation."""
     key1 = generate_idempotency_key("user123", "order456", 9999)
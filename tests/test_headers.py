@@ -0,0 +1,96 @@
+"""Tests for HTTP header utilities."""
+
+from typing import Optional
+
+import pytest
+from fastapi import Request
+
+from payments.utils.headers import (
+    LegacyHeaderParser,
+    RequestContext,
+    build_outbound_headers,
+    build_outbound_headers_bytes,
+    parse_request_context,
+)
+
+
+def make_request(headers: list[tuple[str, str]]) -> Request:
+    """Build a bare request carrying the given headers."""
+    return Request({
+        "type": "http",
+        "headers": [(name.lower().encode(), value.encode()) for name, value in headers],
+    })
+
+
+def test_build_outbound_headers_bytes() -> None:
+    """Test the pre-encoded headers match the str variant."""
+    context = RequestContext(request_id="req_123", user_id="user_456")
+    
+    headers = build_outbound_headers_bytes(context)
+    
+    assert headers == [
+        (b"X-Acme-Request-ID", b"req_123"),
+        (b"X-User-Id", b"user_456"),
+    ]
+
+
+def test_parse_request_context() -> None:
+    """Test context headers are extracted and others ignored."""
+    request = make_request([
+        ("Content-Type", "application/json"),
+        ("X-Acme-Request-ID", "req_123"),
+        ("X-User-Id", "user_456"),
+    ])
+    
+    context = parse_request_context(request)
+    
+    assert context == RequestContext(request_id="req_123", user_id="user_456")
+
+
+def test_parse_request_context_repeated_header() -> None:
+    """Test the first occurrence of a repeated header wins."""
+    request = make_request([
+        ("X-Legacy-User-Id", "first"),
+        ("X-Legacy-User-Id", "second"),
+    ])
+    
+    assert parse_request_context(request).legacy_user_id == "first"
+
+
+def test_build_outbound_headers() -> None:
+    """Test set context values are propagated and missing ones skipped."""
+    context = RequestContext(request_id="req_123", legacy_user_id="legacy_456")
+    
+    headers = build_outbound_headers(context)
+    
+    assert headers == {
+        "X-Acme-Request-ID": "req_123",
+        "X-Legacy-User-Id": "legacy_456",
+    }
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ([("UserId", "oldest"), ("X-User-Id", "current")], "current"),
+        ([("UserId", "oldest"), ("X-UserId", "old")], "old"),
+        ([("X-User-Id", ""), ("X-Legacy-User-Id", "legacy")], "legacy"),
+        ([("Content-Type", "application/json")], None),
+    ],
+)
+def test_legacy_parse_user_id(
+    headers: list[tuple[str, str]],
+    expected: Optional[str],
+) -> None:
+    """Test the highest-priority non-empty user header wins."""
+    assert LegacyHeaderParser.parse_user_id(make_request(headers)) == expected
+
+
+def test_legacy_parse_correlation_id() -> None:
+    """Test the correlation ID falls back to older header names."""
+    request = make_request([
+        ("X-Correlation-ID", "corr_1"),
+        ("X-Request-ID", "req_2"),
+    ])
+    
+    assert LegacyHeaderParser.parse_correlation_id(request) == "req_2"
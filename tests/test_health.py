@@ -1,46 +1,48 @@
 """Tests for health check endpoints."""
 
 import pytest
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 
+from tests.helpers import json_body
 
-def test_health_check(client: TestClient) -> None:
+
+async def test_health_check(client: AsyncClient) -> None:
     """Test basic health check endpoint."""
-    response = client.get("/health")
+    response = await client.get("/health")
     
     assert response.status_code == 200
-    data = response.json()
+    data = json_body(response)
     assert data["status"] == "healthy"
     assert data["service"] == "payments-service"
     assert "version" in data
     assert "timestamp" in data
 
 
-def test_readiness_check(client: TestClient) -> None:
+async def test_readiness_check(client: AsyncClient) -> None:
     """Test readiness check endpoint."""
-    response = client.get("/health/ready")
+    response = await client.get("/health/ready")
     
     assert response.status_code == 200
-    data = response.json()
+    data = json_body(response)
     assert data["ready"] is True
     assert "checks" in data
 
 
-def test_liveness_check(client: TestClient) -> None:
+async def test_liveness_check(client: AsyncClient) -> None:
     """Test liveness check endpoint."""
-    response = client.get("/health/live")
+    response = await client.get("/health/live")
     
     assert response.status_code == 200
-    data = response.json()
+    data = json_body(response)
     assert data["status"] == "alive"
 
 
-def test_service_info(client: TestClient) -> None:
+async def test_service_info(client: AsyncClient) -> None:
     """Test service info endpoint."""
-    response = client.get("/health/info")
+    response = await client.get("/health/info")
     
     assert response.status_code == 200
-    data = response.json()
+    data = json_body(response)
     assert data["service"] == "payments-service"
     assert "v1" in data["api_versions"]
     assert "v2" in data["api_versions"]
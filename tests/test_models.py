@@ -2,11 +2,37 @@
 
 import pytest
 from datetime import datetime
+from typing import Optional
 
 from payments.models.payment import Payment, PaymentStatus, PaymentProvider
 from payments.models.refund import Refund, RefundStatus, RefundReason
 
 
+@pytest.fixture
+def payment() -> Payment:
+    """Pending payment for model tests."""
+    return Payment.create(
+        amount_cents=10000,
+        currency="USD",
+        customer_id="cust_123",
+        order_id="ord_456",
+    )
+
+
+@pytest.fixture
+def authorized_payment(payment: Payment) -> Payment:
+    """Payment authorized but not yet captured."""
+    payment.authorize("pi_test123")
+    return payment
+
+
+@pytest.fixture
+def captured_payment(payment: Payment) -> Payment:
+    """Payment captured in full."""
+    payment.capture()
+    return payment
+
+
 class TestPaymentModel:
     """Tests for the Payment model."""
     
@@ -30,91 +56,89 @@ class TestPaymentModel:
         assert payment.captured_amount_cents == 0
         assert payment.refunded_amount_cents == 0
     
-    def test_authorize_payment(self) -> None:
-        """Test authorizing a payment."""
-        payment = Payment.create(
-            amount_cents=5000,
-            currency="USD",
-            customer_id="cust_123",
-            order_id="ord_456",
-        )
-        
-        payment.authorize("pi_test123")
-        
-        assert payment.status == PaymentStatus.AUTHORIZED
-        assert payment.provider_transaction_id == "pi_test123"
+    def test_payment_to_dict_created_at(self, payment: Payment) -> None:
+        """Test the cached ISO timestamp matches created_at."""
+        assert payment.to_dict()["created_at"] == payment.created_at.isoformat()
     
-    def test_capture_payment_full(self) -> None:
-        """Test capturing a payment fully."""
-        payment = Payment.create(
+    def test_payment_created_at_iso_follows_created_at(self) -> None:
+        """Test the ISO timestamp is always derived from created_at."""
+        created_at = datetime(2024, 1, 2, 3, 4, 5, 678000)
+        payment = Payment(
+            id="pay_0123456789abcdef",
+            status=PaymentStatus.PENDING,
             amount_cents=10000,
             currency="USD",
             customer_id="cust_123",
             order_id="ord_456",
+            provider=PaymentProvider.STRIPE,
+            created_at=created_at,
         )
-        payment.authorize("pi_test123")
-        
-        payment.capture()
         
-        assert payment.status == PaymentStatus.CAPTURED
-        assert payment.captured_amount_cents == 10000
+        assert payment.created_at_iso == "2024-01-02T03:04:05.678000"
+        with pytest.raises(TypeError):
+            Payment(
+                id="pay_0123456789abcdef",
+                status=PaymentStatus.PENDING,
+                amount_cents=10000,
+                currency="USD",
+                customer_id="cust_123",
+                order_id="ord_456",
+                provider=PaymentProvider.STRIPE,
+                created_at_iso="1999-01-01T00:00:00",
+            )
     
-    def test_capture_payment_partial(self) -> None:
-        """Test capturing a payment partially."""
-        payment = Payment.create(
-            amount_cents=10000,
-            currency="USD",
-            customer_id="cust_123",
-            order_id="ord_456",
-        )
+    def test_payment_legacy_id(self, payment: Payment) -> None:
+        """Test the v1 ID is derived once from the payment ID."""
+        assert payment.legacy_id == payment.id.replace("pay_", "PAY-").upper()
+    
+    def test_authorize_payment(self, payment: Payment) -> None:
+        """Test authorizing a payment."""
         payment.authorize("pi_test123")
         
-        payment.capture(5000)
-        
-        assert payment.status == PaymentStatus.CAPTURED
-        assert payment.captured_amount_cents == 5000
+        assert payment.status == PaymentStatus.AUTHORIZED
+        assert payment.provider_transaction_id == "pi_test123"
     
-    def test_refund_payment_full(self) -> None:
-        """Test refunding a payment fully."""
-        payment = Payment.create(
-            amount_cents=10000,
-            currency="USD",
-            customer_id="cust_123",
-            order_id="ord_456",
-        )
-        payment.capture()
-        
-        payment.refund(10000)
-        
-        assert payment.status == PaymentStatus.REFUNDED
-        assert payment.refunded_amount_cents == 10000
-        assert payment.available_refund_amount == 0
+    @pytest.mark.parametrize(
+        ("amount", "expected_captured"),
+        [(None, 10000), (5000, 5000)],
+        ids=["full", "partial"],
+    )
+    def test_capture_payment(
+        self,
+        authorized_payment: Payment,
+        amount: Optional[int],
+        expected_captured: int,
+    ) -> None:
+        """Test capturing a payment fully and partially."""
+        authorized_payment.capture(amount)
+        
+        assert authorized_payment.status == PaymentStatus.CAPTURED
+        assert authorized_payment.captured_amount_cents == expected_captured
     
-    def test_refund_payment_partial(self) -> None:
-        """Test refunding a payment partially."""
-        payment = Payment.create(
-            amount_cents=10000,
-            currency="USD",
-            customer_id="cust_123",
-            order_id="ord_456",
-        )
-        payment.capture()
-        
-        payment.refund(3000)
-        
-        assert payment.status == PaymentStatus.PARTIALLY_REFUNDED
-        assert payment.refunded_amount_cents == 3000
-        assert payment.available_refund_amount == 7000
+    @pytest.mark.parametrize(
+        ("amount", "expected_status", "expected_remaining"),
+        [
+            (10000, PaymentStatus.REFUNDED, 0),
+            (3000, PaymentStatus.PARTIALLY_REFUNDED, 7000),
+        ],
+        ids=["full", "partial"],
+    )
+    def test_refund_payment(
+        self,
+        captured_payment: Payment,
+        amount: int,
+        expected_status: PaymentStatus,
+        expected_remaining: int,
+    ) -> None:
+        """Test refunding a payment fully and partially."""
+        captured_payment.refund(amount)
+        
+        assert captured_payment.status == expected_status
+        assert captured_payment.refunded_amount_cents == amount
+        assert captured_payment.available_refund_amount == expected_remaining
     
-    def test_payment_is_refundable(self) -> None:
+    def test_payment_is_refundable(self, payment: Payment) -> None:
         """Test is_refundable property."""
-        payment = Payment.create(
-            amount_cents=10000,
-            currency="USD",
-            customer_id="cust_123",
-            order_id="ord_456",
-        )
-        
         # Pending payment is not refundable
         assert payment.is_refundable is False
         
@@ -127,6 +151,16 @@ class TestPaymentModel:
         
         # Fully refunded is not refundable
         assert payment.is_refundable is False
+    
+    def test_state_change_clears_cached_responses(self, payment: Payment) -> None:
+        """Test cached API responses are dropped when the payment changes."""
+        payment.cached_response = object()
+        payment.cached_response_v1 = object()
+        
+        payment.capture()
+        
+        assert payment.cached_response is None
+        assert payment.cached_response_v1 is None
 
 
 class TestRefundModel:
@@ -0,0 +1,87 @@
+"""Tests for the payment service."""
+
+import pytest
+
+from payments.services.payment_service import PaymentService
+
+
+@pytest.fixture
+async def seeded_service() -> tuple[PaymentService, list[str]]:
+    """Payment service holding five payments, with IDs in creation order."""
+    service = PaymentService()
+    payment_ids: list[str] = []
+    for customer_id, order_id in [
+        ("cust_a", "ord_1"),
+        ("cust_b", "ord_1"),
+        ("cust_a", "ord_2"),
+        ("cust_b", "ord_2"),
+        ("cust_a", "ord_1"),
+    ]:
+        payment = await service.create_payment(
+            amount_cents=1000,
+            currency="USD",
+            customer_id=customer_id,
+            order_id=order_id,
+        )
+        payment_ids.append(payment.id)
+    
+    return service, payment_ids
+
+
+async def test_list_payments_newest_first(
+    seeded_service: tuple[PaymentService, list[str]],
+) -> None:
+    """Test payments are listed newest first."""
+    service, payment_ids = seeded_service
+    
+    payments = await service.list_payments()
+    
+    assert [p.id for p in payments] == payment_ids[::-1]
+
+
+@pytest.mark.parametrize(
+    ("filters", "expected_indexes"),
+    [
+        ({"customer_id": "cust_a"}, [4, 2, 0]),
+        ({"order_id": "ord_2"}, [3, 2]),
+        ({"customer_id": "cust_a", "order_id": "ord_1"}, [4, 0]),
+        ({"customer_id": "cust_b", "order_id": "ord_1"}, [1]),
+        ({"customer_id": "cust_missing"}, []),
+    ],
+)
+async def test_list_payments_filters(
+    seeded_service: tuple[PaymentService, list[str]],
+    filters: dict[str, str],
+    expected_indexes: list[int],
+) -> None:
+    """Test customer and order filters, alone and combined."""
+    service, payment_ids = seeded_service
+    
+    payments = await service.list_payments(**filters)
+    
+    assert [p.id for p in payments] == [payment_ids[i] for i in expected_indexes]
+
+
+@pytest.mark.parametrize(
+    ("limit", "offset", "expected_indexes"),
+    [
+        (2, 0, [4, 3]),
+        (2, 2, [2, 1]),
+        (2, 4, [0]),
+        (20, 5, []),
+        (20, 10, []),
+        (0, 0, []),
+    ],
+)
+async def test_list_payments_pagination(
+    seeded_service: tuple[PaymentService, list[str]],
+    limit: int,
+    offset: int,
+    expected_indexes: list[int],
+) -> None:
+    """Test offset/limit windows, including an offset past the end."""
+    service, payment_ids = seeded_service
+    
+    payments = await service.list_payments(limit=limit, offset=offset)
+    
+    assert [p.id for p in payments] == [payment_ids[i] for i in expected_indexes]
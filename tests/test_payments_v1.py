@@ -5,17 +5,17 @@ TODO(TEAM-API): Remove after v1 deprecation deadline.
 """
 
 import pytest
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 
+from tests.helpers import json_body
+from tests.payloads import SAMPLE_PAYMENT_REQUEST_V1
 
-def test_create_payment_legacy(
-    client: TestClient,
-    sample_payment_request_v1: dict,
-) -> None:
+
+async def test_create_payment_legacy(client: AsyncClient) -> None:
     """Test creating a payment via deprecated v1 API."""
-    response = client.post(
+    response = await client.post(
         "/api/v1/payments",
-        json=sample_payment_request_v1,
+        json=SAMPLE_PAYMENT_REQUEST_V1,
         headers={
             "X-Acme-Request-ID": "test-request-123",
             "X-Legacy-User-Id": "legacy-user-456",
@@ -23,53 +23,39 @@ def test_create_payment_legacy(
     )
     
     assert response.status_code == 200
-    data = response.json()
+    data = json_body(response)
     assert data["payment_id"].startswith("PAY-")
     assert data["status_code"] == "COMPLETED"
-    assert data["amount"] == sample_payment_request_v1["amount"]
-    assert data["currency_code"] == sample_payment_request_v1["currency_code"]
-    assert data["user_id"] == sample_payment_request_v1["user_id"]
+    assert data["amount"] == SAMPLE_PAYMENT_REQUEST_V1["amount"]
+    assert data["currency_code"] == SAMPLE_PAYMENT_REQUEST_V1["currency_code"]
+    assert data["user_id"] == SAMPLE_PAYMENT_REQUEST_V1["user_id"]
 
 
-def test_create_payment_legacy_with_idempotency(
-    client: TestClient,
-    sample_payment_request_v1: dict,
-) -> None:
+async def test_create_payment_legacy_with_idempotency(client: AsyncClient) -> None:
     """Test creating a payment with idempotency key."""
-    response = client.post(
+    response = await client.post(
         "/api/v1/payments",
-        json=sample_payment_request_v1,
+        json=SAMPLE_PAYMENT_REQUEST_V1,
         headers={"X-Idempotency-Key": "test-idempotency-key"},
     )
     
     assert response.status_code == 200
 
 
-def test_get_payment_legacy(client: TestClient) -> None:
+@pytest.mark.usefixtures("use_shared_payment_service")
+async def test_get_payment_legacy(client: AsyncClient, seeded_payment_v1: dict) -> None:
     """Test getting a payment via v1 API."""
-    # First create a payment
-    create_response = client.post(
-        "/api/v1/payments",
-        json={
-            "amount": 5000,
-            "currency_code": "USD",
-            "user_id": "user_test",
-            "order_reference": "ORD-TEST",
-        },
-    )
-    
-    payment_id = create_response.json()["payment_id"]
+    payment_id = seeded_payment_v1["payment_id"]
     
-    # Then fetch it
-    response = client.get(f"/api/v1/payments/{payment_id}")
+    response = await client.get(f"/api/v1/payments/{payment_id}")
     
     assert response.status_code == 200
-    data = response.json()
+    data = json_body(response)
     assert data["payment_id"] == payment_id
 
 
-def test_get_payment_legacy_not_found(client: TestClient) -> None:
+async def test_get_payment_legacy_not_found(client: AsyncClient) -> None:
     """Test getting a non-existent payment."""
-    response = client.get("/api/v1/payments/PAY-NONEXISTENT123456")
+    response = await client.get("/api/v1/payments/PAY-NONEXISTENT123456")
     
     assert response.status_code == 404
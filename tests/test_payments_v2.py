@@ -1,48 +1,63 @@
 """Tests for v2 payment endpoints."""
 
 import pytest
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 
+from tests.helpers import json_body
+from tests.payloads import SAMPLE_PAYMENT_REQUEST
 
-def test_create_payment(client: TestClient, sample_payment_request: dict) -> None:
+
+async def test_create_payment(client: AsyncClient) -> None:
     """Test creating a payment via v2 API."""
-    response = client.post(
+    response = await client.post(
         "/api/v2/payments",
-        json=sample_payment_request,
+        json=SAMPLE_PAYMENT_REQUEST,
         headers={"X-Acme-Request-ID": "test-request-123"},
     )
     
     assert response.status_code == 201
-    data = response.json()
+    data = json_body(response)
     assert data["id"].startswith("pay_")
     assert data["status"] == "captured"
-    assert data["amount_cents"] == sample_payment_request["amount_cents"]
-    assert data["currency"] == sample_payment_request["currency"]
-    assert data["customer_id"] == sample_payment_request["customer_id"]
-    assert data["order_id"] == sample_payment_request["order_id"]
+    assert data["amount_cents"] == SAMPLE_PAYMENT_REQUEST["amount_cents"]
+    assert data["currency"] == SAMPLE_PAYMENT_REQUEST["currency"]
+    assert data["customer_id"] == SAMPLE_PAYMENT_REQUEST["customer_id"]
+    assert data["order_id"] == SAMPLE_PAYMENT_REQUEST["order_id"]
 
 
-def test_create_payment_with_authorization(
-    client: TestClient,
-    sample_payment_request: dict,
-) -> None:
+async def test_create_payment_with_authorization(client: AsyncClient) -> None:
     """Test creating an authorized (not captured) payment."""
-    sample_payment_request["capture_immediately"] = False
+    payload = SAMPLE_PAYMENT_REQUEST | {"capture_immediately": False}
     
-    response = client.post(
+    response = await client.post(
         "/api/v2/payments",
-        json=sample_payment_request,
+        json=payload,
     )
     
     assert response.status_code == 201
-    data = response.json()
+    data = json_body(response)
     assert data["status"] == "authorized"
     assert data["captured_amount_cents"] == 0
 
 
-def test_create_payment_validation_error(client: TestClient) -> None:
+async def test_create_payment_paypal(client: AsyncClient) -> None:
+    """Test the provider round-trips through the response."""
+    payload = SAMPLE_PAYMENT_REQUEST | {"provider": "paypal"}
+    
+    response = await client.post(
+        "/api/v2/payments",
+        json=payload,
+    )
+    
+    assert response.status_code == 201
+    data = json_body(response)
+    assert data["provider"] == "paypal"
+    assert data["provider_transaction_id"].startswith("CAP-")
+
+
+async def test_create_payment_validation_error(client: AsyncClient) -> None:
     """Test payment creation with invalid data."""
-    response = client.post(
+    response = await client.post(
         "/api/v2/payments",
         json={
             "amount_cents": -100,  # Invalid: negative amount
@@ -55,31 +70,56 @@ def test_create_payment_validation_error(client: TestClient) -> None:
     assert response.status_code == 422
 
 
-def test_list_payments(client: TestClient, sample_payment_request: dict) -> None:
-    """Test listing payments."""
-    # Create a payment first
-    client.post("/api/v2/payments", json=sample_payment_request)
+@pytest.mark.xfail(
+    strict=True,
+    reason="PaymentService is built per request, so payments do not persist",
+)
+async def test_get_payment_after_create(client: AsyncClient) -> None:
+    """Test a created payment can be read back through the real dependencies."""
+    create_response = await client.post("/api/v2/payments", json=SAMPLE_PAYMENT_REQUEST)
+    payment_id = json_body(create_response)["id"]
     
-    response = client.get("/api/v2/payments")
+    response = await client.get(f"/api/v2/payments/{payment_id}")
     
     assert response.status_code == 200
-    data = response.json()
+
+
+@pytest.mark.usefixtures("use_shared_payment_service")
+async def test_list_payments(client: AsyncClient, seeded_payment: dict) -> None:
+    """Test listing payments."""
+    response = await client.get("/api/v2/payments")
+    
+    assert response.status_code == 200
+    data = json_body(response)
     assert isinstance(data, list)
+    assert seeded_payment["id"] in [p["id"] for p in data]
 
 
-def test_list_payments_with_filter(
-    client: TestClient,
-    sample_payment_request: dict,
+@pytest.mark.usefixtures("use_shared_payment_service")
+async def test_list_payments_with_filter(
+    client: AsyncClient,
+    seeded_payment: dict,
 ) -> None:
     """Test listing payments with customer filter."""
-    # Create a payment first
-    client.post("/api/v2/payments", json=sample_payment_request)
-    
-    response = client.get(
+    response = await client.get(
         "/api/v2/payments",
-        params={"customer_id": sample_payment_request["customer_id"]},
+        params={"customer_id": seeded_payment["customer_id"]},
     )
     
     assert response.status_code == 200
-    data = response.json()
+    data = json_body(response)
     assert isinstance(data, list)
+    assert seeded_payment["id"] in [p["id"] for p in data]
+    assert {p["customer_id"] for p in data} == {seeded_payment["customer_id"]}
+
+
+@pytest.mark.parametrize("run", [1, 2])
+@pytest.mark.usefixtures("use_shared_payment_service")
+async def test_shared_payment_service_isolated_per_test(client: AsyncClient, run: int) -> None:
+    """Test payments created in one test are gone from the shared service in the next."""
+    payload = SAMPLE_PAYMENT_REQUEST | {"customer_id": "cust_isolation"}
+    await client.post("/api/v2/payments", json=payload)
+    
+    response = await client.get("/api/v2/payments", params={"customer_id": "cust_isolation"})
+    
+    assert len(json_body(response)) == 1
@@ -0,0 +1,36 @@
+"""Tests for the refund service."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from payments.errors import RefundExceedsPaymentError
+from payments.interfaces.payment_client import RefundResult
+from payments.providers.stripe_client import StripePaymentClient
+from payments.services.refund_service import RefundService
+
+
+class SlowRefundClient(StripePaymentClient):
+    """Stripe mock whose refunds yield to the event loop before completing."""
+    
+    async def refund(self, **kwargs: Any) -> RefundResult:
+        """Process a refund after a short delay."""
+        await asyncio.sleep(0.01)
+        return await super().refund(**kwargs)
+
+
+async def test_concurrent_refunds_are_all_recorded() -> None:
+    """Test refunds that overlap the provider call all count against the payment."""
+    service = RefundService(payment_client=SlowRefundClient())
+    
+    refunds = await asyncio.gather(
+        *(service.create_refund("pay_demo123", amount_cents=3000) for _ in range(3))
+    )
+    
+    assert [r.amount_cents for r in refunds] == [3000, 3000, 3000]
+    # 9000 of 10000 refunded, so only 1000 remains
+    with pytest.raises(RefundExceedsPaymentError):
+        await service.create_refund("pay_demo123", amount_cents=2000)
+    refund = await service.create_refund("pay_demo123", amount_cents=1000)
+    assert refund.amount_cents == 1000
@@ -1,28 +1,31 @@
 """Tests for v2 refund endpoints."""
 
 import pytest
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 
+from tests.helpers import json_body
+from tests.payloads import SAMPLE_REFUND_REQUEST
 
-def test_create_refund(client: TestClient, sample_refund_request: dict) -> None:
+
+async def test_create_refund(client: AsyncClient) -> None:
     """Test creating a refund via v2 API."""
-    response = client.post(
+    response = await client.post(
         "/api/v2/refunds",
-        json=sample_refund_request,
+        json=SAMPLE_REFUND_REQUEST,
         headers={"X-Acme-Request-ID": "test-request-123"},
     )
     
     assert response.status_code == 201
-    data = response.json()
+    data = json_body(response)
     assert data["id"].startswith("ref_")
     assert data["status"] == "completed"
-    assert data["amount_cents"] == sample_refund_request["amount_cents"]
-    assert data["payment_id"] == sample_refund_request["payment_id"]
+    assert data["amount_cents"] == SAMPLE_REFUND_REQUEST["amount_cents"]
+    assert data["payment_id"] == SAMPLE_REFUND_REQUEST["payment_id"]
 
 
-def test_create_full_refund(client: TestClient) -> None:
+async def test_create_full_refund(client: AsyncClient) -> None:
     """Test creating a full refund (no amount specified)."""
-    response = client.post(
+    response = await client.post(
         "/api/v2/refunds",
         json={
             "payment_id": "pay_demo123",
@@ -31,33 +34,27 @@ def test_create_full_refund(client: TestClient) -> None:
     )
     
     assert response.status_code == 201
-    data = response.json()
+    data = json_body(response)
     assert data["reason"] == "order_cancelled"
 
 
-def test_list_refunds(client: TestClient, sample_refund_request: dict) -> None:
+async def test_list_refunds(client: AsyncClient, seeded_refund: dict) -> None:
     """Test listing refunds."""
-    # Create a refund first
-    client.post("/api/v2/refunds", json=sample_refund_request)
-    
-    response = client.get("/api/v2/refunds")
+    response = await client.get("/api/v2/refunds")
     
     assert response.status_code == 200
-    data = response.json()
+    data = json_body(response)
     assert isinstance(data, list)
 
 
-def test_list_refunds_by_payment(
-    client: TestClient,
-    sample_refund_request: dict,
+async def test_list_refunds_by_payment(
+    client: AsyncClient,
+    seeded_refund: dict,
 ) -> None:
     """Test listing refunds filtered by payment."""
-    # Create a refund first
-    client.post("/api/v2/refunds", json=sample_refund_request)
-    
-    response = client.get(
+    response = await client.get(
         "/api/v2/refunds",
-        params={"payment_id": sample_refund_request["payment_id"]},
+        params={"payment_id": seeded_refund["payment_id"]},
     )
     
     assert response.status_code == 200
@@ -0,0 +1,97 @@
+"""Tests for the transaction manager."""
+
+import asyncio
+import gc
+import weakref
+
+import pytest
+
+from payments.services.transaction_manager import TransactionManager, TransactionState
+
+
+def test_transaction_commits() -> None:
+    """Test a successful transaction block commits."""
+    manager = TransactionManager()
+    
+    with manager.transaction() as txn:
+        assert manager.in_transaction is True
+        manager.record_operation("capture", {"payment_id": "pay_123"})
+    
+    assert txn.state == TransactionState.COMMITTED
+    assert manager.in_transaction is False
+
+
+def test_transaction_rolls_back_on_error() -> None:
+    """Test an exception inside a transaction block rolls it back."""
+    manager = TransactionManager()
+    
+    with pytest.raises(ValueError):
+        with manager.transaction() as txn:
+            raise ValueError("boom")
+    
+    assert txn.state == TransactionState.ROLLED_BACK
+    assert manager.in_transaction is False
+
+
+def test_transaction_to_dict() -> None:
+    """Test recorded operations are serialized with ISO timestamps."""
+    manager = TransactionManager()
+    txn = manager.begin()
+    
+    manager.record_operation("capture", {"payment_id": "pay_123"})
+    data = txn.to_dict()
+    
+    assert data["state"] == "active"
+    assert data["started_at"] == txn.started_at.isoformat()
+    assert data["operations"][0]["type"] == "capture"
+    assert data["operations"][0]["data"] == {"payment_id": "pay_123"}
+    assert data["operations"][0]["timestamp"] >= data["started_at"]
+
+
+async def test_transactions_are_scoped_per_task() -> None:
+    """Test concurrent tasks can each hold a transaction on one manager."""
+    manager = TransactionManager()
+    
+    async def run(operation_type: str) -> int:
+        with manager.transaction() as txn:
+            manager.record_operation(operation_type, {})
+            await asyncio.sleep(0)
+            manager.record_operation(operation_type, {})
+        return len(txn.operations)
+    
+    counts = await asyncio.gather(run("capture"), run("refund"))
+    
+    assert counts == [2, 2]
+    assert manager.in_transaction is False
+
+
+def test_many_managers_share_context() -> None:
+    """Test managers keep working, and are not retained, after many are created."""
+    for _ in range(1000):
+        with TransactionManager().transaction():
+            pass
+    
+    manager = TransactionManager()
+    with manager.transaction() as txn:
+        assert manager.in_transaction is True
+        assert TransactionManager().in_transaction is False
+    
+    assert txn.state == TransactionState.COMMITTED
+    
+    manager_ref = weakref.ref(manager)
+    del manager
+    gc.collect()
+    assert manager_ref() is None
+
+
+def test_transaction_logs_are_bounded() -> None:
+    """Test old logs are dropped while the sink still sees every event."""
+    sunk = []
+    manager = TransactionManager(max_logs=2, log_sink=sunk.append)
+    
+    for _ in range(3):
+        with manager.transaction():
+            pass
+    
+    assert len(manager.transaction_logs) == 2
+    assert [log.event for log in sunk] == ["COMMITTED"] * 3
@@ -0,0 +1,81 @@
+"""Tests for validation utilities."""
+
+import pytest
+
+from payments.errors import ValidationError
+from payments.utils.validators import (
+    normalize_legacy_id,
+    validate_currency_code,
+    validate_payment_id,
+    validate_refund_id,
+)
+
+
+def test_validate_currency_code_normalizes() -> None:
+    """Test currency codes are stripped and uppercased."""
+    assert validate_currency_code(" usd ") == "USD"
+
+
+def test_validate_currency_code_unlisted() -> None:
+    """Test well-formed codes outside the known list are allowed."""
+    assert validate_currency_code("XYZ") == "XYZ"
+
+
+@pytest.mark.parametrize("currency", ["US", "USDD", "U5D", "", "ÉÉÉ"])
+def test_validate_currency_code_invalid(currency: str) -> None:
+    """Test malformed currency codes are rejected."""
+    with pytest.raises(ValidationError):
+        validate_currency_code(currency)
+
+
+@pytest.mark.parametrize("payment_id", ["pay_0123456789abcdef", "PAY-0123456789ABCDEF"])
+def test_validate_payment_id(payment_id: str) -> None:
+    """Test modern and legacy payment IDs are accepted."""
+    assert validate_payment_id(payment_id) == payment_id
+
+
+@pytest.mark.parametrize(
+    "payment_id",
+    [
+        "",
+        "pay_0123456789ABCDEF",
+        "PAY-0123456789abcdef",
+        "pay_0123",
+        "ref_0123456789abcdef",
+        "pay_0123456789abcdeg",
+        "pay_0123456789abcdeé",
+    ],
+)
+def test_validate_payment_id_invalid(payment_id: str) -> None:
+    """Test malformed payment IDs are rejected."""
+    with pytest.raises(ValidationError):
+        validate_payment_id(payment_id)
+
+
+@pytest.mark.parametrize("refund_id", ["ref_0123456789abcdef", "REF-0123456789ABCDEF"])
+def test_validate_refund_id(refund_id: str) -> None:
+    """Test modern and legacy refund IDs are accepted."""
+    assert validate_refund_id(refund_id) == refund_id
+
+
+def test_validate_refund_id_invalid() -> None:
+    """Test malformed refund IDs are rejected."""
+    with pytest.raises(ValidationError):
+        validate_refund_id("ref_0123456789abcdef0")
+
+
+@pytest.mark.parametrize(
+    ("legacy_id", "prefix", "expected"),
+    [
+        ("PAY-0123456789ABCDEF", "pay", "pay_0123456789abcdef"),
+        ("REF-0123456789ABCDEF", "ref", "ref_0123456789abcdef"),
+        ("PAY-AB-CD", "pay", "pay_ab-cd"),
+        ("PAY-ABCÉ", "pay", "pay_abcé"),
+        ("PAY-0123456789ABCDEF", "Pay", "Pay_0123456789abcdef"),
+        ("pay_0123456789abcdef", "pay", "pay_0123456789abcdef"),
+        ("REF-0123456789ABCDEF", "pay", "REF-0123456789ABCDEF"),
+    ],
+)
+def test_normalize_legacy_id(legacy_id: str, prefix: str, expected: str) -> None:
+    """Test legacy IDs are converted and other IDs pass through."""
+    assert normalize_legacy_id(legacy_id, prefix) == expected